@@ -1,18 +1,29 @@
-counter = 0
-number = 50
+import os
 
-with open('C:\\Users\\sk019655\\AdventofCode\\Day1\\input.txt') as f:
-    lines = f.readlines()
-    for line in lines:
-        line = line.strip()
-        if line.startswith('R'):
-            num = line.split('R')[1]
-            number = (number + int(num)) % 100
-        elif line.startswith('L'):
-            num = line.split('L')[1]
-            number = (number - int(num)) % 100
+def solve_problem(fname):
+    if len(fname) < 1:
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
 
-        if number == 0:
-            counter +=1
+    counter = 0
+    number = 50
 
-print('Counter:',counter)
\ No newline at end of file
+    with open(fname) as f:
+        lines = f.readlines()
+        for line in lines:
+            line = line.strip()
+            if line.startswith('R'):
+                num = line.split('R')[1]
+                number = (number + int(num)) % 100
+            elif line.startswith('L'):
+                num = line.split('L')[1]
+                number = (number - int(num)) % 100
+
+            if number == 0:
+                counter +=1
+
+    print('Counter:',counter)
+    return counter
+
+
+if __name__ == '__main__':
+    solve_problem('')
@@ -1,7 +1,9 @@
+import os
+
 def count_zeros_in_rotation(start_pos, direction, steps):
     """
     Count how many times the dial points to 0 during a rotation.
-    Uses step-by-step simulation for accuracy.
+    Computed arithmetically, so the cost does not depend on the number of steps.
     
     start_pos: starting position (0-99)
     direction: 'R' for right (increasing), 'L' for left (decreasing)  
@@ -9,39 +11,42 @@ def count_zeros_in_rotation(start_pos, direction, steps):
     
     Returns: (count_of_zeros, final_position)
     """
-    if steps == 0:
-        return 0, start_pos
-    
-    count = 0
-    current = start_pos
-    
-    for _ in range(steps):
-        if direction == 'R':
-            current = (current + 1) % 100
-        else:  # 'L'
-            current = (current - 1) % 100
-        
-        if current == 0:
-            count += 1
+    if direction == 'R':
+        # 0 is passed at the clicks that reach 100, 200, ... counting up from start_pos
+        count = (start_pos + steps) // 100
+        current = (start_pos + steps) % 100
+    else:  # 'L'
+        # Turning left from start_pos is turning right from the mirrored position
+        count = (steps + (-start_pos) % 100) // 100
+        current = (start_pos - steps) % 100
     
     return count, current
 
-counter = 0
-number = 50
-
-with open('C:\\Users\\sk019655\\AdventofCode\\Day1\\input.txt') as f:
-    lines = f.readlines()
-    for line in lines:
-        line = line.strip()  # Remove newline characters
-        
-        if line.startswith('R'):
-            num = int(line[1:])  # Get the number after 'R'
-            zeros_hit, number = count_zeros_in_rotation(number, 'R', num)
-            counter += zeros_hit
-
-        elif line.startswith('L'):
-            num = int(line[1:])  # Get the number after 'L'
-            zeros_hit, number = count_zeros_in_rotation(number, 'L', num)
-            counter += zeros_hit
-
-print('Counter:', counter)
\ No newline at end of file
+def solve_problem(fname):
+    if len(fname) < 1:
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+
+    counter = 0
+    number = 50
+
+    with open(fname) as f:
+        lines = f.readlines()
+        for line in lines:
+            line = line.strip()  # Remove newline characters
+            
+            if line.startswith('R'):
+                num = int(line[1:])  # Get the number after 'R'
+                zeros_hit, number = count_zeros_in_rotation(number, 'R', num)
+                counter += zeros_hit
+
+            elif line.startswith('L'):
+                num = int(line[1:])  # Get the number after 'L'
+                zeros_hit, number = count_zeros_in_rotation(number, 'L', num)
+                counter += zeros_hit
+
+    print('Counter:', counter)
+    return counter
+
+
+if __name__ == '__main__':
+    solve_problem('')
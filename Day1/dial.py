@@ -0,0 +1,193 @@
+import argparse
+import math
+import os
+import re
+from multiprocessing import Pool
+
+import numpy as np
+
+DIAL_SIZE = 100
+START_POSITION = 50
+MAX_CHUNK_BYTES = 64 * 1024 * 1024 # upper bound for the text a worker reads at once
+
+def rotations_from_tokens(tokens):
+    """
+    Converts instruction tokens (bytes like b'R34') into one signed array.
+    Right rotations are positive, left rotations negative.
+    """
+    steps = np.fromiter((int(token[1:]) for token in tokens), dtype=np.int64, count=len(tokens))
+    left = np.fromiter((token[0] == ord('L') for token in tokens), dtype=bool, count=len(tokens))
+    return np.where(left, -steps, steps)
+
+def parse_rotations(fname):
+    """
+    Reads the rotation instructions into one signed array.
+    param fname: input file path
+    return: numpy int64 array with one entry per instruction
+    """
+    with open(fname, 'rb') as f:
+        return rotations_from_tokens(f.read().split()) # one instruction per whitespace separated token
+
+def count_zeros_batch(rotations, start=START_POSITION):
+    """
+    Simulates all rotations at once.
+    param rotations: signed steps as returned by parse_rotations
+    param start: position of the dial before the first rotation
+    return: (part1, part2) - rotations ending on 0, and clicks passing 0
+    """
+    if len(rotations) == 0:
+        return 0, 0
+
+    steps = np.abs(rotations)
+    ends = (start + np.cumsum(rotations % DIAL_SIZE)) % DIAL_SIZE # dial position after each rotation
+    starts = np.concatenate(([start], ends[:-1])) # dial position before each rotation
+
+    part1 = int(np.count_nonzero(ends == 0))
+
+    # Same closed form as count_zeros_in_rotation in day1_part2.py
+    hits = np.where(rotations > 0,
+                    (starts + steps) // DIAL_SIZE,
+                    (steps + (-starts) % DIAL_SIZE) // DIAL_SIZE)
+    part2 = int(hits.sum())
+    return part1, part2
+
+def summarize_rotations(rotations):
+    """
+    Describes a segment of rotations independent of the position the dial has
+    when the segment starts.
+    param rotations: signed steps of the segment
+    return: (offset, part1, part2) - offset is how far the segment turns the
+            dial, part1[p] and part2[p] are the counters of the segment when
+            it is entered at position p
+    """
+    moves = rotations % DIAL_SIZE
+    prefix = np.cumsum(moves) % DIAL_SIZE # position after each rotation, relative to the entry position
+    before = np.concatenate(([0], prefix[:-1])) # relative position before each rotation
+    offset = int(prefix[-1]) if len(prefix) else 0
+
+    # Part 1: rotation i ends on 0 exactly for the entry position -prefix[i]
+    part1 = np.bincount((-prefix) % DIAL_SIZE, minlength=DIAL_SIZE).astype(np.int64)
+
+    # Part 2: every full turn passes 0 once, whatever the entry position.
+    # The remaining rem = steps % 100 clicks pass 0 only from rem start positions:
+    # [100 - rem, 99] turning right, [1, rem] turning left. Seen from the entry
+    # position this is a cyclic interval of length rem, added with a difference array.
+    steps = np.abs(rotations)
+    rem = steps % DIAL_SIZE
+    first = np.where(rotations > 0, DIAL_SIZE - rem, 1) # first start position that passes 0
+    lo = (first - before) % DIAL_SIZE # same interval, as entry position
+    diff = (np.bincount(lo, minlength=2 * DIAL_SIZE)
+            - np.bincount(lo + rem, minlength=2 * DIAL_SIZE))
+    covered = np.cumsum(diff)
+    part2 = covered[:DIAL_SIZE] + covered[DIAL_SIZE:2 * DIAL_SIZE] # fold the wrap around back
+    part2 = part2.astype(np.int64) + int((steps // DIAL_SIZE).sum())
+
+    return offset, part1, part2
+
+def compose_summaries(first, second):
+    """
+    Combines the summaries of two consecutive segments into the summary of
+    both. Composition is associative, so segments can be summarized in any
+    grouping and combined in order.
+    """
+    offset1, part1_a, part2_a = first
+    offset2, part1_b, part2_b = second
+    # Entering the whole at p enters the second segment at p + offset1
+    return ((offset1 + offset2) % DIAL_SIZE,
+            part1_a + np.roll(part1_b, -offset1),
+            part2_a + np.roll(part2_b, -offset1))
+
+def summarize_chunk(task):
+    """
+    Worker: reads one byte range of a rotation log and summarizes it.
+    param task: (fname, start, end) with start and end at line boundaries
+    """
+    fname, start, end = task
+    with open(fname, 'rb') as f:
+        f.seek(start)
+        tokens = f.read(end - start).split()
+    return summarize_rotations(rotations_from_tokens(tokens))
+
+def natural_key(name):
+    """
+    Sort key that compares runs of digits as numbers, so "shard2" comes before "shard10".
+    """
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name)]
+
+def split_file(fname, chunks):
+    """
+    Splits a file into about `chunks` byte ranges that start and end at line boundaries.
+    return: list of (fname, start, end)
+    """
+    size = os.path.getsize(fname)
+    chunks = max(chunks, math.ceil(size / MAX_CHUNK_BYTES))
+    boundaries = [0]
+    with open(fname, 'rb') as f:
+        for i in range(1, chunks):
+            f.seek(max(size * i // chunks, boundaries[-1]))
+            f.readline() # move to the start of the next line
+            boundaries.append(min(f.tell(), size))
+    boundaries.append(size)
+
+    tasks = []
+    for start, end in zip(boundaries, boundaries[1:]):
+        if start < end:
+            tasks.append((fname, start, end))
+    return tasks
+
+def solve_parallel(path, workers=None):
+    """
+    Solves both parts for a huge rotation log, or for a directory of shard files
+    using a process pool. Shards are read in natural file name order, numbers in
+    the names are compared as numbers: shard2 comes before shard10.
+    Each worker summarizes a chunk, the summaries are composed in order.
+    param path: rotation log or directory of shards
+    param workers: number of processes (default: number of CPUs)
+    return: (part1, part2)
+    """
+    if len(path) < 1:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+
+    if os.path.isdir(path):
+        files = [os.path.join(path, name) for name in sorted(os.listdir(path), key=natural_key)]
+        files = [f for f in files if os.path.isfile(f)]
+    else:
+        files = [path]
+
+    workers = workers or os.cpu_count() or 1
+    tasks = []
+    for fname in files:
+        tasks.extend(split_file(fname, max(1, 4 * workers // len(files))))
+
+    total = (0, np.zeros(DIAL_SIZE, dtype=np.int64), np.zeros(DIAL_SIZE, dtype=np.int64))
+    with Pool(workers) as pool:
+        for summary in pool.imap(summarize_chunk, tasks): # imap keeps the order of the chunks
+            total = compose_summaries(total, summary)
+
+    _, part1, part2 = total
+    return int(part1[START_POSITION]), int(part2[START_POSITION])
+
+def solve_batch(fname):
+    if len(fname) < 1:
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+
+    part1, part2 = count_zeros_batch(parse_rotations(fname))
+    print('Counter part 1:', part1)
+    print('Counter part 2:', part2)
+    return part1, part2
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Day 1 dial simulation for large rotation logs')
+    parser.add_argument('path', nargs='?', default='', help='rotation log or directory of shard files, '
+                        'read in natural name order (shard2 before shard10)')
+    parser.add_argument('--parallel', action='store_true', help='split the work across a process pool')
+    parser.add_argument('--workers', type=int, help='number of worker processes')
+    args = parser.parse_args()
+
+    if args.parallel or os.path.isdir(args.path):
+        part1, part2 = solve_parallel(args.path, args.workers)
+        print('Counter part 1:', part1)
+        print('Counter part 2:', part2)
+    else:
+        solve_batch(args.path)
@@ -1,5 +1,8 @@
+import os
 import pulp
 
+SOLVES_PART = 2 # joltage puzzle as an ILP, an alternative to day10part2.py
+
 def parse_machine(line):
     """
     Parses a machine configuration line into buttons and targets.
@@ -100,6 +103,15 @@ def solve_part2(input_file):
     print(f'\nTotal button presses for all machines: {total_presses}')
     return total_presses
 
+def solve_problem(fname):
+    """
+    Solves Part 2 for the given input file, falling back to the input.txt
+    next to this script.
+    """
+    if len(fname) < 1:
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+    return solve_part2(fname)
+
 def test_examples():
     """
     Test with the provided examples to verify correctness.
@@ -131,9 +143,7 @@ if __name__ == "__main__":
     
     # Get input file path from user
     input_file = input("Enter path to input file (or press Enter for default): ").strip()
-    if not input_file:
-        input_file = "/workspaces/AdventofCode/Day10/input.txt"
     
     # Solve part 2
     print("\nSolving Part 2...")
-    total_presses = solve_part2(input_file)
\ No newline at end of file
+    total_presses = solve_problem(input_file)
\ No newline at end of file
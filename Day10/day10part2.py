@@ -1,3 +1,4 @@
+import os
 import itertools
 from fractions import Fraction
 
@@ -152,7 +153,7 @@ def solve_machine_exhaustive(line, line_num):
 
 def solve_factory_final(fname):
     if len(fname) < 1:
-        fname = '/workspaces/AdventofCode/Day10/input.txt' 
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt') 
         
     total_presses = 0
     try:
@@ -179,6 +180,10 @@ def solve_factory_final(fname):
     print("-" * 30)
     print(f"NEUES ERGEBNIS: {total_presses}")
     print("-" * 30)
+    return total_presses
+
+def solve_problem(fname):
+    return solve_factory_final(fname)
 
 if __name__ == "__main__":
     fname = input('Dateinamen eingeben (Enter für Standard): ')
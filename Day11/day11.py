@@ -1,3 +1,5 @@
+import os
+
 def solve_problem(fname):
     """
     Solves the problem of counting distinct paths from 'you' to 'out' in a directed graph.
@@ -9,7 +11,7 @@ def solve_problem(fname):
     """
     
     if len(fname) < 1:
-        fname = '/workspaces/AdventofCode/Day11/input.txt'
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
 
     graph = {} # read in the graph as adjacency list
     
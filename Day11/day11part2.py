@@ -1,3 +1,4 @@
+import os
 import sys
 
 def solve_problem(fname):
@@ -10,7 +11,7 @@ def solve_problem(fname):
     """
     
     if len(fname) < 1:
-        fname = '/workspaces/AdventofCode/Day11/input.txt'
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
 
     graph = {} # read in the graph as adjacency list
     
@@ -1,3 +1,4 @@
+import os
 import sys
 
 def parse_input(filename):
@@ -205,11 +206,16 @@ def backtrack(grid, width, height, remaining_presents, variations_cache):
     # If no variation fits in any position
     return False
 
-def main():
-    # Use input() or default to file
-    fname = input("Enter input file path (or press Enter for default): ").strip()
+def solve_problem(fname):
+    """
+    Counts the regions that can fit all of their presents.
+    parameters:
+        fname: str - input file path, empty for the default input.txt
+    returns:
+        int - number of regions that can be filled
+    """
     if len(fname) < 1:
-        fname = '/workspaces/AdventofCode/Day12/input.txt'
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
         
     print(f"--- Loading data from {fname} ---")
     shapes, regions = parse_input(fname)
@@ -248,6 +254,12 @@ def main():
             print("Failed.")
             
     print(f"Total regions that can fit all presents: {solved_count}")
+    return solved_count
+
+def main():
+    # Use input() or default to file
+    fname = input("Enter input file path (or press Enter for default): ").strip()
+    solve_problem(fname)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,3 +1,25 @@
+import os
+
+def sum_doubled_in_range(start, end):
+    """
+    Sums all numbers in [start, end] that are some digits repeated twice.
+    A doubled number with m-digit halves h is h * (10^m + 1), so for every
+    half length m the valid halves form one interval and their sum is an
+    arithmetic series. The cost only depends on the number of digits.
+    param start: first ID of the range
+    param end: last ID of the range (inclusive)
+    return: sum of the doubled IDs in the range
+    """
+    total = 0
+    for m in range(1, len(str(end)) // 2 + 1): # half length, the number has 2*m digits
+        factor = 10 ** m + 1
+        lo = max(10 ** (m - 1), -(-start // factor)) # smallest half h with h * factor >= start
+        hi = min(10 ** m - 1, end // factor) # largest half h with h * factor <= end
+        if lo <= hi:
+            total += factor * (lo + hi) * (hi - lo + 1) // 2
+    return total
+
+
 def solve_problem(arr):
    sum = 0
    for i in arr:
@@ -5,27 +27,22 @@ def solve_problem(arr):
        start = int(nums[0])
        end = int(nums[1])
 
-       
-       for num in range(start,end+1):
-           number = str(num)
-           
-           if len(number) % 2 != 0:
-             continue
-           
-           
-           mid = len(number) // 2
-           first_part = number[:mid]
-           second_part = number[mid:]
-
-           if (first_part == second_part):
-               sum += int(number)
+       sum += sum_doubled_in_range(start, end)
         
    return sum
 
 
-with open('/workspaces/AdventofCode/Day2/input.txt') as f:
-    lines = f.read()
-    numbers = [x for x in lines.split(',')]
-    print(numbers)
-    total = solve_problem(numbers)
-    print('Total :',total )
\ No newline at end of file
+def solve_file(fname):
+    if len(fname) < 1:
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+
+    with open(fname) as f:
+        lines = f.read()
+        numbers = [x for x in lines.split(',')]
+        total = solve_problem(numbers)
+        print('Total :',total )
+    return total
+
+
+if __name__ == '__main__':
+    solve_file('')
@@ -1,3 +1,57 @@
+import os
+
+def moebius(n):
+    """
+    Möbius-Funktion: 0 wenn n einen quadratischen Teiler hat,
+    sonst (-1) hoch Anzahl der Primfaktoren.
+    """
+    ergebnis = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            ergebnis = -ergebnis
+        p += 1
+    if n > 1:
+        ergebnis = -ergebnis
+    return ergebnis
+
+
+def summe_mit_periode(start, end, length, d):
+    """
+    Summe aller Zahlen mit genau 'length' Stellen in [start, end],
+    die aus einem d-stelligen Muster p bestehen, das length/d mal wiederholt wird.
+    Diese Zahlen sind p * (10^length - 1) / (10^d - 1), also eine arithmetische Reihe in p.
+    """
+    faktor = (10 ** length - 1) // (10 ** d - 1)  # z.B. length=6, d=2 -> 10101
+    lo = max(10 ** (d - 1), -(-start // faktor))  # kleinstes Muster im Bereich
+    hi = min(10 ** d - 1, end // faktor)  # größtes Muster im Bereich
+    if lo > hi:
+        return 0
+    return faktor * (lo + hi) * (hi - lo + 1) // 2
+
+
+def sum_periodic_in_range(start, end):
+    """
+    Summe aller Zahlen in [start, end], die aus einem wiederholten Muster bestehen.
+    Eine Zahl mit mehreren Perioden (z.B. 222222 mit Periode 1, 2 und 3) darf nur
+    einmal gezählt werden. Die Perioden d einer Länge L bilden den Teilerverband von L,
+    Inklusion-Exklusion darüber ergibt die Möbius-Gewichte -μ(L/d).
+    Der Aufwand hängt nur von der Anzahl der Stellen ab, nicht von der Breite des Bereichs.
+    """
+    total_sum = 0
+    for length in range(len(str(start)), len(str(end)) + 1):
+        for d in range(1, length // 2 + 1):  # echte Teiler von length
+            if length % d != 0:
+                continue
+            gewicht = -moebius(length // d)
+            if gewicht:
+                total_sum += gewicht * summe_mit_periode(start, end, length, d)
+    return total_sum
+
+
 def solve_problem(arr):
     total_sum = 0  # Besser nicht 'sum' nennen, da sum() eine Python-Funktion ist
     
@@ -7,41 +61,24 @@ def solve_problem(arr):
         start = int(nums[0])
         end = int(nums[1])
 
-        for num in range(start, end + 1):
-            number_text = str(num)  # Variable umbenannt
-            length = len(number_text)
-            
-            is_invalid = False
-
-            # Wir testen Musterlängen (n)
-            for n in range(1, length // 2 + 1):
-                
-                # Wenn die Länge nicht glatt teilbar ist, überspringen
-                if length % n != 0:
-                    continue
-                
-                muster = number_text[:n]
-                anzahl = length // n
-                
-                # Hier 'test_string' statt 'str' benutzen
-                test_string = muster * anzahl
-                
-                # WICHTIG: Diese Prüfung muss IN der Schleife sein (eingerückt!)
-                if test_string == number_text:
-                    is_invalid = True
-                    break  # Sobald wir ein Muster finden, aufhören zu suchen
-
-            if is_invalid:
-                total_sum += num
+        total_sum += sum_periodic_in_range(start, end)
         
     return total_sum
 
-# Datei einlesen
-# Pfad ggf. anpassen
-with open('/workspaces/AdventofCode/Day2/input.txt') as f:
-    content = f.read()
-    # strip() ist wichtig, falls am Ende der Datei eine leere Zeile ist
-    numbers = content.strip().split(',')
-    
-    total = solve_problem(numbers)
-    print('Total:', total)
\ No newline at end of file
+def solve_file(fname):
+    # Datei einlesen, Standard ist die input.txt neben diesem Skript
+    if len(fname) < 1:
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+
+    with open(fname) as f:
+        content = f.read()
+        # strip() ist wichtig, falls am Ende der Datei eine leere Zeile ist
+        numbers = content.strip().split(',')
+        
+        total = solve_problem(numbers)
+        print('Total:', total)
+    return total
+
+
+if __name__ == '__main__':
+    solve_file('')
@@ -0,0 +1,175 @@
+import argparse
+import bisect
+import mmap
+import os
+import struct
+from array import array
+
+# Header: magic, part (1 = doubled IDs, 2 = any repeated pattern), max digits, number of IDs
+HEADER = struct.Struct('<8sQQQ')
+MAGIC = b'AOCIDX1\0'
+MASK64 = (1 << 64) - 1
+
+
+def merge_ranges(ranges):
+    """
+    Sorts the ranges and merges overlapping or touching ones,
+    so every ID is only counted once.
+    param ranges: list of (start, end) tuples, end inclusive
+    return: sorted list of disjoint (start, end) tuples
+    """
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1: # overlap with the previous range
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def read_ranges(fname):
+    """
+    Reads a comma separated range file like "11-22,95-115".
+    """
+    with open(fname) as f:
+        content = f.read().strip()
+    ranges = []
+    for part in content.split(','):
+        part = part.strip()
+        if part:
+            start, end = part.split('-')
+            ranges.append((int(start), int(end)))
+    return ranges
+
+
+def generate_invalid_ids(part, max_digits):
+    """
+    Generates all invalid IDs with at most max_digits digits, sorted.
+    Part 1: a pattern repeated exactly twice. Part 2: repeated at least twice.
+    """
+    ids = []
+    for length in range(2, max_digits + 1):
+        if part == 1:
+            periods = [length // 2] if length % 2 == 0 else []
+        else:
+            periods = [d for d in range(1, length // 2 + 1) if length % d == 0]
+
+        same_length = set() # a number can have several periods, e.g. 222222
+        for d in periods:
+            factor = (10 ** length - 1) // (10 ** d - 1)
+            same_length.update(p * factor for p in range(10 ** (d - 1), 10 ** d))
+        ids.extend(sorted(same_length)) # all shorter numbers are smaller, so ids stays sorted
+    return ids
+
+
+def build_index(fname, part, max_digits):
+    """
+    Writes the sorted invalid IDs and their prefix sums to fname.
+    The prefix sums can exceed 64 bits, so they are stored as two
+    arrays of low and high 64-bit words.
+    """
+    if not 2 <= max_digits <= 19:
+        raise ValueError('max_digits must be between 2 and 19, IDs are stored as 64-bit integers')
+
+    ids = generate_invalid_ids(part, max_digits)
+    prefix_lo = array('Q', [0])
+    prefix_hi = array('Q', [0])
+    running = 0
+    for value in ids:
+        running += value
+        prefix_lo.append(running & MASK64)
+        prefix_hi.append(running >> 64)
+
+    tmp_name = fname + '.tmp'
+    with open(tmp_name, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, part, max_digits, len(ids)))
+        array('Q', ids).tofile(f)
+        prefix_lo.tofile(f)
+        prefix_hi.tofile(f)
+    os.replace(tmp_name, fname)
+
+
+class InvalidIdIndex:
+    """
+    Memory mapped index of all invalid IDs up to a number of digits.
+    A range query is two bisect lookups plus a prefix sum difference.
+    """
+    def __init__(self, fname):
+        with open(fname, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.part, self.max_digits, count = HEADER.unpack_from(self.mm)
+        if magic != MAGIC:
+            raise ValueError(f'{fname} is not an invalid ID index')
+
+        words = memoryview(self.mm)[HEADER.size:].cast('Q')
+        self.ids = words[:count]
+        self.prefix_lo = words[count:2 * count + 1]
+        self.prefix_hi = words[2 * count + 1:3 * count + 2]
+
+    def prefix_sum(self, i):
+        return (self.prefix_hi[i] << 64) | self.prefix_lo[i]
+
+    def sum_in_range(self, start, end):
+        """
+        Sum of all invalid IDs in [start, end].
+        """
+        if end >= 10 ** self.max_digits:
+            raise ValueError(f'range end {end} has more than {self.max_digits} digits, rebuild the index with more digits')
+        i = bisect.bisect_left(self.ids, start)
+        j = bisect.bisect_right(self.ids, end)
+        return self.prefix_sum(j) - self.prefix_sum(i)
+
+    def sum_ranges(self, ranges):
+        """
+        Merges the ranges first, so overlapping ranges are answered once.
+        """
+        return sum(self.sum_in_range(start, end) for start, end in merge_ranges(ranges))
+
+    def close(self):
+        # release the views before the mapping can be closed
+        self.ids.release()
+        self.prefix_lo.release()
+        self.prefix_hi.release()
+        self.mm.close()
+
+
+def default_index_path(part, max_digits):
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), f'invalid_ids_part{part}_{max_digits}.idx')
+
+
+def open_index(part, max_digits, fname=None, rebuild=False):
+    """
+    Opens the index, building it first if it does not exist yet.
+    An existing index must be built for the same part and cover at least max_digits.
+    """
+    fname = fname or default_index_path(part, max_digits)
+    if rebuild or not os.path.exists(fname):
+        build_index(fname, part, max_digits)
+
+    index = InvalidIdIndex(fname)
+    if index.part != part or index.max_digits < max_digits:
+        found_part, found_digits = index.part, index.max_digits
+        index.close()
+        raise ValueError(f'{fname} was built for part {found_part} with {found_digits} digits, '
+                         f'not part {part} with {max_digits} digits; use --rebuild to rebuild it')
+    return index
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Answer Day 2 range files with a precomputed invalid ID index')
+    parser.add_argument('files', nargs='*', help='comma separated range files (default: input.txt)')
+    parser.add_argument('--part', type=int, choices=(1, 2), default=2, help='1: doubled IDs, 2: any repeated pattern')
+    parser.add_argument('--digits', type=int, default=12, help='largest number of digits covered by the index')
+    parser.add_argument('--index', help='index file (default: next to this script)')
+    parser.add_argument('--rebuild', action='store_true', help='rebuild the index even if it exists')
+    args = parser.parse_args()
+
+    files = args.files or [os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')]
+    try:
+        index = open_index(args.part, args.digits, args.index, args.rebuild)
+    except ValueError as error:
+        parser.error(str(error))
+    for fname in files:
+        print(f'{fname}: {index.sum_ranges(read_ranges(fname))}')
+    index.close()
@@ -0,0 +1,135 @@
+import argparse
+import math
+import mmap
+import os
+from multiprocessing import Pool
+
+import numpy as np
+
+from joltage import largest_subsequences
+
+CHUNK_BYTES = 8 * 1024 * 1024 # text handled by one task
+NEWLINE = ord('\n')
+CARRIAGE_RETURN = ord('\r')
+
+def split_file(fname, chunk_bytes=CHUNK_BYTES):
+    """
+    Splits a file into byte ranges of about chunk_bytes that start and end at line boundaries.
+    return: list of (start, end)
+    """
+    size = os.path.getsize(fname)
+    chunks = max(1, math.ceil(size / chunk_bytes))
+    boundaries = [0]
+    with open(fname, 'rb') as f:
+        for i in range(1, chunks):
+            f.seek(max(size * i // chunks, boundaries[-1]))
+            f.readline() # move to the start of the next line
+            boundaries.append(min(f.tell(), size))
+    boundaries.append(size)
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end]
+
+def select_digits(digits, k):
+    """
+    Largest k-digit subsequence for every row of an equal-length digit matrix.
+    Picks the leftmost maximum of the allowed window for each of the k places,
+    for all rows at once.
+    param digits: int8 array of shape (rows, n) with values 0-9
+    param k: number of digits to pick (at most 18, so the result fits in int64)
+    return: int64 array with the largest number of every row
+    """
+    rows, n = digits.shape
+    columns = np.arange(n)
+    start = np.zeros(rows, dtype=np.int64) # first column each row may still pick from
+    values = np.zeros(rows, dtype=np.int64)
+    row_index = np.arange(rows)
+
+    for place in range(k):
+        last = n - k + place # leave enough digits for the remaining places
+        allowed = (columns >= start[:, None]) & (columns <= last)
+        pos = np.where(allowed, digits, -1).argmax(axis=1) # argmax returns the leftmost maximum
+        values = values * 10 + digits[row_index, pos]
+        start = pos + 1
+    return values
+
+def sum_chunk(task):
+    """
+    Worker: sums the largest k-digit numbers of all lines in one byte range of
+    the file, for every k, reading the range only once.
+    param task: (fname, start, end, ks)
+    return: list of totals, one per k
+    """
+    fname, start, end, ks = task
+    totals = [0] * len(ks)
+    with open(fname, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = np.frombuffer(mm, dtype=np.uint8, count=end - start, offset=start)
+
+            # line boundaries of the chunk
+            line_ends = np.flatnonzero(data == NEWLINE)
+            if len(line_ends) == 0 or line_ends[-1] != len(data) - 1:
+                line_ends = np.append(line_ends, len(data)) # last line without newline
+            line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+            lengths = line_ends - line_starts
+            has_cr = (lengths > 0) & (data[np.maximum(line_ends - 1, 0)] == CARRIAGE_RETURN)
+            lengths = lengths - has_cr
+
+            # equal length lines are handled together
+            for n in np.unique(lengths):
+                n = int(n)
+                if n == 0:
+                    continue # empty line
+                rows = line_starts[lengths == n]
+                if max(ks) > n:
+                    raise ValueError(f"Cannot pick {max(ks)} digits from a line of {n} digits")
+
+                # k > 18 is too large for int64, those use the exact Python version
+                small = [i for i, k in enumerate(ks) if k <= 18]
+                large = [i for i, k in enumerate(ks) if k > 18]
+                if small:
+                    digits = (data[rows[:, None] + np.arange(n)] - ord('0')).astype(np.int8)
+                    for i in small:
+                        values = select_digits(digits, ks[i])
+                        # add in two halves, so the sum cannot overflow int64
+                        totals[i] += int((values // 10 ** 9).sum()) * 10 ** 9 + int((values % 10 ** 9).sum())
+                if large:
+                    large_ks = [ks[i] for i in large]
+                    for row in rows:
+                        line = bytes(data[row:row + n]).decode()
+                        for i, value in zip(large, largest_subsequences(line, large_ks)):
+                            totals[i] += value
+            del data # release the buffer before the mapping is closed
+    return totals
+
+def solve_stream(fname, ks=(2, 12), workers=None, chunk_bytes=CHUNK_BYTES):
+    """
+    Sums the largest k-digit joltage of every bank without reading the whole file.
+    The file is memory mapped and split into line aligned chunks that are
+    processed by a pool of worker processes. All k are computed from the same
+    read of a chunk, so the file is only scanned once.
+    param fname: input file path
+    param ks: numbers of batteries per bank (2 for part 1, 12 for part 2)
+    param workers: number of processes (default: number of CPUs)
+    return: list of total output joltages, one per k
+    """
+    if len(fname) < 1:
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+
+    ks = list(ks)
+    tasks = [(fname, start, end, ks) for start, end in split_file(fname, chunk_bytes)]
+    if len(tasks) <= 1: # no pool needed for a single chunk
+        results = map(sum_chunk, tasks)
+        return [sum(column) for column in zip(*results)] if tasks else [0] * len(ks)
+
+    with Pool(workers or os.cpu_count() or 1) as pool:
+        return [sum(column) for column in zip(*pool.imap_unordered(sum_chunk, tasks))]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Day 3 streaming solver for very large battery bank files')
+    parser.add_argument('fname', nargs='?', default='', help='input file (default: input.txt)')
+    parser.add_argument('-k', type=int, nargs='+', default=[2, 12], help='digits per bank (default: 2 and 12)')
+    parser.add_argument('--workers', type=int, help='number of worker processes')
+    args = parser.parse_args()
+
+    for k, total in zip(args.k, solve_stream(args.fname, args.k, args.workers)):
+        print(f'Total for k={k}:', total)
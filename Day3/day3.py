@@ -1,19 +1,20 @@
+import os
+from joltage import largest_subsequence
+
 def solve_problem(fname):
     if len(fname) < 1:
-        fname = '/workspaces/AdventofCode/Day3/input.txt'
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
 
     total = 0
     with open(fname,'r') as f:
         lines = f.readlines()
         for line in lines:
             line = line.strip()
-            num1 = max(line[:len(line)-1])
-            maxindex = line.index(num1)
-            total += int(num1)*10
-            num2 = max(line[maxindex+1:])
-            total += int(num2)            
+            if line:
+                total += largest_subsequence(line, 2)
     
     print('Total:', total)
+    return total
             
     
 
@@ -1,6 +1,9 @@
+import os
+from joltage import largest_subsequence
+
 def solve_problem(fname):
     if len(fname) < 1:
-        fname = '/workspaces/AdventofCode/Day3/input.txt'
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
 
     total = 0
     K = 12
@@ -8,25 +11,11 @@ def solve_problem(fname):
         lines = f.readlines()
         for line in lines:
             line = line.strip()
-            n = len(line)
-            result = ""
-
-            start = 0
-            for num in range(K):
-                remaining = K - num
-                end = n -remaining
-
-                segment = line[start:end+1]
-                max_digit = max(segment)
-
-                position = line.find(max_digit, start)
-
-                result += max_digit
-                start = position + 1
-
-            total += int(result)       
+            if line:
+                total += largest_subsequence(line, K)
             
     print('Total:', total)
+    return total
 
 
 if __name__ == "__main__":
@@ -0,0 +1,51 @@
+def largest_subsequences(line, ks):
+    """
+    Finds the largest number that can be formed by keeping k digits of the line
+    in their order, for several k at once, in a single pass over the line.
+    For every k a monotonic stack of at most k digits is kept: a digit pops
+    smaller digits before it as long as enough digits are left to still fill
+    k places. Once no digit may be left out anymore, the rest of the line is
+    taken as it is, and the pass ends when this is true for every k.
+    param line: string of digits
+    param ks: list of digit counts
+    return: list of the largest numbers, one per k
+    """
+    n = len(line)
+    for k in ks:
+        if not 0 < k <= n:
+            raise ValueError(f"Cannot pick {k} digits from a line of {n} digits")
+
+    stacks = [[] for _ in ks] # one stack per k
+    drops = [n - k for k in ks] # how many digits may still be left out for each k
+    active = list(range(len(ks))) # the k that still need digits
+
+    for i, digit in enumerate(line):
+        finished = False
+        for j in active:
+            stack, drop = stacks[j], drops[j]
+            while drop and stack and stack[-1] < digit: # a bigger digit replaces smaller ones before it
+                stack.pop()
+                drop -= 1
+            if not drop: # nothing may be left out anymore, the rest is taken as it is
+                stack.extend(line[i:])
+                finished = True
+            elif len(stack) < ks[j]:
+                stack.append(digit)
+            else: # the stack is full and digit is not bigger than its top, so it is left out
+                drop -= 1
+            drops[j] = drop
+        if finished:
+            active = [j for j in active if drops[j]]
+            if not active:
+                break
+
+    return [int(''.join(stack)) for stack in stacks]
+
+def largest_subsequence(line, k):
+    """
+    Largest number made of k digits of the line, keeping their order. O(n).
+    param line: string of digits
+    param k: number of digits to pick
+    return: the largest k-digit number
+    """
+    return largest_subsequences(line, [k])[0]
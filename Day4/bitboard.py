@@ -0,0 +1,95 @@
+def read_bitboard(fname):
+    """
+    Reads the grid as one integer bitmask per row, one bit per cell.
+    Bit 0 is the rightmost cell of the row.
+    return: (rows, width) - list of row masks and the number of columns
+    """
+    to_bits = bytes.maketrans(b'@.', b'10')
+    rows = []
+    width = None
+    with open(fname, 'rb') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if width is None:
+                width = len(line)
+            elif len(line) != width:
+                raise ValueError('All rows of the grid must have the same length')
+            rows.append(int(line.translate(to_bits), 2))
+    return rows, width
+
+def full_adder(a, b, c):
+    """
+    Adds three bitmasks bit by bit: returns the sum bits and the carry bits.
+    """
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+def at_least_four(above, row, below, full):
+    """
+    Mask of the cells of `row` that have 4 or more rolls among their 8 neighbours.
+    The 8 neighbour masks are added with a carry-save adder tree, one bit plane
+    per binary digit of the count, for all cells of the row at once.
+    param above, row, below: row masks (0 outside the grid)
+    param full: mask with a 1 for every column
+    """
+    # the 8 neighbours: left/right shifted rows above and below, and the row itself shifted
+    n0, n1, n2 = (above << 1) & full, above, above >> 1
+    n3, n4 = (row << 1) & full, row >> 1
+    n5, n6, n7 = (below << 1) & full, below, below >> 1
+
+    ones_a, twos_a = full_adder(n0, n1, n2)
+    ones_b, twos_b = full_adder(n3, n4, n5)
+    ones_c, twos_c = n6 ^ n7, n6 & n7 # half adder
+    _, twos_d = full_adder(ones_a, ones_b, ones_c) # the ones digit itself is not needed
+
+    # four bits of weight 2: their sum reaches weight 4 if it is 2 or more
+    twos_sum, fours_a = full_adder(twos_a, twos_b, twos_c)
+    fours_b = twos_sum & twos_d
+    return fours_a | fours_b # count >= 4 (fours_a & fours_b means count == 8)
+
+def accessible_masks(rows, width, indices):
+    """
+    Accessible rolls (fewer than 4 neighbouring rolls) for the given row indices.
+    return: dict row index -> mask of accessible rolls (only non-empty masks)
+    """
+    full = (1 << width) - 1
+    last = len(rows) - 1
+    masks = {}
+    for r in indices:
+        above = rows[r - 1] if r > 0 else 0
+        below = rows[r + 1] if r < last else 0
+        mask = rows[r] & ~at_least_four(above, rows[r], below, full)
+        if mask:
+            masks[r] = mask
+    return masks
+
+def count_accessible_bitboard(rows, width):
+    """
+    Part 1: number of accessible rolls.
+    """
+    masks = accessible_masks(rows, width, range(len(rows)))
+    return sum(mask.bit_count() for mask in masks.values())
+
+def count_removable_bitboard(rows, width):
+    """
+    Part 2: removes all accessible rolls round by round until none are left.
+    Each round removes the accessible rolls of all rows at once, and only rows
+    next to a row that changed are looked at again in the next round.
+    param rows: row masks, changed in place
+    return: number of removed rolls
+    """
+    removed = 0
+    dirty = range(len(rows))
+    while True:
+        masks = accessible_masks(rows, width, dirty)
+        if not masks:
+            return removed
+
+        next_dirty = set()
+        for r, mask in masks.items():
+            rows[r] &= ~mask
+            removed += mask.bit_count()
+            next_dirty.update((r - 1, r, r + 1))
+        dirty = sorted(r for r in next_dirty if 0 <= r < len(rows))
@@ -1,7 +1,12 @@
-def solve_problem(fname):
-    if len(fname) < 1:
-        fname = '/workspaces/AdventofCode/Day4/input.txt'
+import os
+
+ENGINES = ('loop', 'numpy', 'rounds', 'stream', 'bitboard', 'tiled')
 
+def count_accessible_loop(fname):
+    """
+    Counts the rolls with fewer than 4 neighbouring rolls by checking
+    the 8 neighbours of every cell.
+    """
     grid = [] #2D list for the grid
     with open(fname,'r') as f:
         lines = f.readlines()
@@ -39,8 +44,35 @@ def solve_problem(fname):
                 if nachbarn < 4: # If less than 4 neighbors are occupied
                     total +=1   # Increment total count
 
+    return total
+
+
+def solve_problem(fname, engine='loop'):
+    if len(fname) < 1:
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+
+    if engine == 'loop':
+        total = count_accessible_loop(fname)
+    elif engine == 'numpy':
+        import rolls # only imported here, so the loop engine does not pay for numpy
+        total = rolls.count_accessible(rolls.load_grid(fname))
+    elif engine == 'rounds':
+        from peeling import RemovalSchedule
+        total = RemovalSchedule.from_file(fname).part1
+    elif engine == 'stream':
+        from row_stream import count_accessible_stream
+        total = count_accessible_stream(fname)
+    elif engine == 'bitboard':
+        from bitboard import read_bitboard, count_accessible_bitboard
+        total = count_accessible_bitboard(*read_bitboard(fname))
+    elif engine == 'tiled':
+        from tiled import run_tiled
+        total = run_tiled(fname, part=1)
+    else:
+        raise ValueError(f"Unknown engine '{engine}', choose from: {', '.join(ENGINES)}")
     
     print('Total :',total)
+    return total
 
 
 if __name__ == '__main__':
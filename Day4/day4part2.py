@@ -1,7 +1,13 @@
-def solve_problem(fname):
-    if len(fname) < 1:
-        fname = '/workspaces/AdventofCode/Day4/input.txt'
+import os
+from peeling import read_padded_grid, count_removable_worklist, RemovalSchedule
+from bitboard import read_bitboard, count_removable_bitboard
+
+ENGINES = ('loop', 'worklist', 'rounds', 'bitboard', 'tiled')
 
+def count_removable_loop(fname):
+    """
+    Removes accessible rolls by rescanning the whole grid until nothing changes.
+    """
     grid = [] #2D list for the grid
     with open(fname,'r') as f:
         lines = f.readlines()
@@ -48,7 +54,30 @@ def solve_problem(fname):
         else:
             changed = False
 
+    return total
+
+
+def solve_problem(fname, engine='loop'):
+    if len(fname) < 1:
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+
+    if engine == 'loop':
+        total = count_removable_loop(fname)
+    elif engine == 'worklist':
+        cells, rows, cols, width = read_padded_grid(fname)
+        total = count_removable_worklist(cells, width)
+    elif engine == 'rounds':
+        total = RemovalSchedule.from_file(fname).part2
+    elif engine == 'bitboard':
+        total = count_removable_bitboard(*read_bitboard(fname))
+    elif engine == 'tiled':
+        from tiled import run_tiled # numpy and multiprocessing only when needed
+        total = run_tiled(fname, part=2)
+    else:
+        raise ValueError(f"Unknown engine '{engine}', choose from: {', '.join(ENGINES)}")
+
     print('Total :',total)  
+    return total
 
 
 if __name__ == '__main__':
@@ -0,0 +1,158 @@
+import argparse
+import os
+from array import array
+from collections import deque
+
+def read_padded_grid(fname):
+    """
+    Reads the grid into a flat bytearray with a border of empty cells around it,
+    so the 8 neighbours of every real cell can be looked at without bounds checks.
+    param fname: input file path
+    return: (cells, rows, cols, width) - cells[i] is 1 for a roll, width = cols + 2
+    """
+    with open(fname, 'rb') as f:
+        lines = [line.strip() for line in f]
+    lines = [line for line in lines if line] # skip empty lines
+
+    rows = len(lines)
+    cols = len(lines[0])
+    width = cols + 2
+    cells = bytearray(width * (rows + 2))
+    for r, line in enumerate(lines):
+        if len(line) != cols:
+            raise ValueError('All rows of the grid must have the same length')
+        start = (r + 1) * width + 1
+        cells[start:start + cols] = line.replace(b'.', b'\x00').replace(b'@', b'\x01')
+    return cells, rows, cols, width
+
+def peel(cells, width, round_of=None):
+    """
+    Removes rolls with fewer than 4 neighbouring rolls until none is left.
+    The neighbour counts are computed once. Removing a roll decrements the counts
+    of its neighbours, and only a neighbour whose count just dropped below 4 is
+    put on the worklist, so every cell is looked at a constant number of times.
+    The queue is processed in FIFO order, so a roll that drops below 4 neighbours
+    while the rolls of round t are removed belongs to round t + 1.
+    param cells: padded flat grid from read_padded_grid, changed in place
+    param width: row length of the padded grid
+    param round_of: optional list with one entry per padded cell, filled with the
+                    round in which each roll is removed
+    return: number of removed rolls
+    """
+    offsets = (-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1)
+
+    counts = [0] * len(cells)
+    queue = deque()
+    for i, cell in enumerate(cells):
+        if cell:
+            count = sum(cells[i + o] for o in offsets)
+            counts[i] = count
+            if count < 4: # accessible right away
+                queue.append(i)
+                if round_of is not None:
+                    round_of[i] = 1
+
+    removed = 0
+    while queue:
+        i = queue.popleft()
+        cells[i] = 0
+        removed += 1
+        for o in offsets:
+            n = i + o
+            if cells[n]:
+                counts[n] -= 1
+                # counts only go down, so each roll is queued at most once:
+                # either from the start or when its count goes from 4 to 3
+                if counts[n] == 3:
+                    queue.append(n)
+                    if round_of is not None:
+                        round_of[n] = round_of[i] + 1
+    return removed
+
+def count_removable_worklist(cells, width):
+    """
+    Part 2 with the worklist of peel(), without recording the rounds.
+    return: number of removed rolls
+    """
+    return peel(cells, width)
+
+def removal_rounds(cells, rows, cols, width):
+    """
+    Assigns every roll the round in which it is removed. In round 1 all rolls
+    that are accessible in the original grid are removed at the same time, in
+    round t + 1 all rolls that became accessible through the removals of round t.
+    param cells: padded flat grid from read_padded_grid, changed in place
+    return: array('I') with rows * cols entries in row order, the round of every
+            cell, 0 for empty cells and rolls that are never removed
+    """
+    round_of = [0] * len(cells) # round per padded cell
+    peel(cells, width, round_of)
+
+    rounds = array('I')
+    for r in range(1, rows + 1): # drop the border
+        rounds.extend(round_of[r * width + 1:r * width + 1 + cols])
+    return rounds
+
+class RemovalSchedule:
+    """
+    Removal round of every cell, plus a prefix sum over the rounds to answer
+    "how many rolls are gone after t rounds" in O(1).
+    """
+    def __init__(self, rounds, cols):
+        self.rounds = rounds # array('I'), see removal_rounds
+        self.cols = cols
+
+        histogram = [0] * (max(rounds, default=0) + 1) # rolls removed per round
+        for t in rounds:
+            histogram[t] += 1
+        histogram[0] = 0 # 0 means not removed
+
+        self.removed_until = [0] * len(histogram) # removed_until[t] = rolls removed in rounds 1..t
+        for t in range(1, len(histogram)):
+            self.removed_until[t] = self.removed_until[t - 1] + histogram[t]
+
+    @classmethod
+    def from_file(cls, fname):
+        cells, rows, cols, width = read_padded_grid(fname)
+        return cls(removal_rounds(cells, rows, cols, width), cols)
+
+    @property
+    def last_round(self):
+        return len(self.removed_until) - 1
+
+    def removed_after(self, t):
+        """
+        Number of rolls removed after t rounds.
+        """
+        if t < 0:
+            raise ValueError('t must not be negative')
+        return self.removed_until[min(t, self.last_round)]
+
+    def round_of(self, r, c):
+        """
+        Round in which the cell (r, c) is removed, 0 if never.
+        """
+        return self.rounds[r * self.cols + c]
+
+    @property
+    def part1(self):
+        return self.removed_after(1)
+
+    @property
+    def part2(self):
+        return self.removed_until[-1]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Day 4: removal round of every roll, all answers from one pass')
+    parser.add_argument('fname', nargs='?', default='', help='input file (default: input.txt)')
+    parser.add_argument('-t', type=int, nargs='*', default=[], help='also print the rolls removed after t rounds')
+    args = parser.parse_args()
+
+    fname = args.fname or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+    schedule = RemovalSchedule.from_file(fname)
+    print('Part 1:', schedule.part1)
+    print('Part 2:', schedule.part2)
+    print('Rounds until nothing is accessible:', schedule.last_round)
+    for t in args.t:
+        print(f'Removed after {t} rounds: {schedule.removed_after(t)}')
@@ -0,0 +1,50 @@
+import numpy as np
+
+ROLL = ord('@')
+
+def load_grid(fname):
+    """
+    Reads the grid into a uint8 array: 1 for a roll '@', 0 for an empty cell.
+    param fname: input file path
+    return: numpy array of shape (rows, cols)
+    """
+    with open(fname, 'rb') as f:
+        lines = [line.strip() for line in f]
+    lines = [line for line in lines if line] # skip empty lines
+
+    cols = len(lines[0])
+    if any(len(line) != cols for line in lines):
+        raise ValueError('All rows of the grid must have the same length')
+
+    cells = np.frombuffer(b''.join(lines), dtype=np.uint8).reshape(len(lines), cols)
+    return (cells == ROLL).astype(np.uint8)
+
+def count_neighbors(grid):
+    """
+    Counts the rolls among the 8 neighbours of every cell.
+    The grid is padded with a border of zeros and the 8 shifted views of the
+    padded grid are added up, so there is no loop over the cells.
+    param grid: uint8 array, 1 for a roll
+    return: uint8 array of the same shape with the neighbour counts (0-8)
+    """
+    rows, cols = grid.shape
+    padded = np.pad(grid, 1)
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for dr in (0, 1, 2):
+        for dc in (0, 1, 2):
+            if dr == 1 and dc == 1: # skip the cell itself
+                continue
+            counts += padded[dr:dr + rows, dc:dc + cols]
+    return counts
+
+def accessible(grid):
+    """
+    Boolean mask of the rolls with fewer than 4 neighbouring rolls.
+    """
+    return (grid == 1) & (count_neighbors(grid) < 4)
+
+def count_accessible(grid):
+    """
+    Part 1: number of rolls that can be reached by a forklift.
+    """
+    return int(np.count_nonzero(accessible(grid)))
@@ -0,0 +1,58 @@
+# Translation tables: '@' -> 1, everything else -> 0, and count -> 1 if the count is below 4
+TO_BITS = bytes(1 if b == ord('@') else 0 for b in range(256))
+BELOW_FOUR = bytes(1 if b < 4 else 0 for b in range(256))
+
+def iter_rows(fname):
+    """
+    Yields the rows of the grid one by one as big integers with one byte per
+    cell (0x01 for a roll, 0x00 for an empty cell), first cell in the highest byte.
+    return: generator of (row_value, width)
+    """
+    width = None
+    with open(fname, 'rb') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if width is None:
+                width = len(line)
+            elif len(line) != width:
+                raise ValueError('All rows of the grid must have the same length')
+            yield int.from_bytes(line.translate(TO_BITS), 'big'), width
+
+def accessible_in_row(above, row, below, width):
+    """
+    Counts the accessible rolls of one row from the row and its two neighbours.
+    Every byte of the integers is one cell. Neighbour counts are at most 8, so
+    adding the integers adds all cells at once without carries between bytes,
+    and shifting by 8 bits moves every cell one column.
+    """
+    mask = (1 << (8 * width)) - 1
+    column = above + row + below # rolls in the 3 cells of every column
+    box = column + ((column << 8) & mask) + (column >> 8) # rolls in every 3x3 box
+    neighbours = box - row # without the cell itself
+    below_four = int.from_bytes(neighbours.to_bytes(width, 'big').translate(BELOW_FOUR), 'big')
+    return (below_four & row).bit_count() # every accessible roll is one 0x01 byte
+
+def iter_accessible_counts(fname):
+    """
+    Streams the grid and yields the number of accessible rolls row by row.
+    Only three rows are kept at any time (the row, the row above and the row
+    below), so memory is O(width) however many rows the grid has.
+    """
+    above = 0
+    row = None
+    width = 0
+    for below, width in iter_rows(fname):
+        if row is not None:
+            yield accessible_in_row(above, row, below, width)
+            above = row
+        row = below
+    if row is not None: # last row, nothing below it
+        yield accessible_in_row(above, row, 0, width)
+
+def count_accessible_stream(fname):
+    """
+    Part 1 in O(width) memory.
+    """
+    return sum(iter_accessible_counts(fname))
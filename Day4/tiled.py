@@ -0,0 +1,99 @@
+import math
+import os
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+from rolls import load_grid, count_neighbors
+
+# Views on the shared memory, set up once per worker process by attach()
+shared = {}
+
+def attach(grid_name, removal_name, rows, cols):
+    """
+    Pool initializer: maps the shared grid and removal buffers into the worker.
+    """
+    for key, name in (('grid', grid_name), ('removal', removal_name)):
+        shm = shared_memory.SharedMemory(name=name)
+        shared[key + '_shm'] = shm # keep the mapping alive
+        shared[key] = np.ndarray((rows, cols), dtype=np.uint8, buffer=shm.buf)
+
+def find_accessible(band):
+    """
+    Worker, phase 1 of a round: marks the accessible rolls of one band of rows.
+    The row above and below the band (the halo) are read directly from the
+    neighbouring bands in shared memory. The grid is not changed in this phase,
+    so all bands see the same state.
+    param band: (start, end) row range
+    return: number of accessible rolls in the band
+    """
+    start, end = band
+    grid = shared['grid']
+    top = max(start - 1, 0)
+    bottom = min(end + 1, grid.shape[0])
+
+    counts = count_neighbors(grid[top:bottom]) # band plus halo rows
+    rolls = grid[start:end]
+    accessible = (rolls == 1) & (counts[start - top:start - top + end - start] < 4)
+    shared['removal'][start:end] = accessible
+    return int(np.count_nonzero(accessible))
+
+def remove_accessible(band):
+    """
+    Worker, phase 2 of a round: removes the rolls marked in phase 1 from one band.
+    """
+    start, end = band
+    shared['grid'][start:end] &= 1 - shared['removal'][start:end]
+
+def make_bands(rows, workers):
+    """
+    Splits the rows into about two bands per worker.
+    """
+    band_rows = max(1, math.ceil(rows / (2 * workers)))
+    return [(start, min(start + band_rows, rows)) for start in range(0, rows, band_rows)]
+
+def run_tiled(fname, part, workers=None):
+    """
+    Solves Day 4 with the grid split into bands of rows that are processed by a
+    pool of worker processes over shared memory.
+    Every round has two phases, so no worker reads a halo row that another
+    worker is changing at the same time: first all bands mark their accessible
+    rolls, then all bands remove them. Only bands that changed in the last
+    round, or border a band that did, are processed again.
+    param part: 1 for a single round, 2 to repeat until nothing is accessible
+    return: number of removed (part 1: accessible) rolls
+    """
+    grid = load_grid(fname)
+    rows, cols = grid.shape
+    workers = workers or os.cpu_count() or 1
+    bands = make_bands(rows, workers)
+
+    grid_shm = shared_memory.SharedMemory(create=True, size=grid.nbytes)
+    removal_shm = shared_memory.SharedMemory(create=True, size=grid.nbytes)
+    try:
+        np.ndarray(grid.shape, dtype=np.uint8, buffer=grid_shm.buf)[:] = grid
+        del grid
+
+        with Pool(workers, initializer=attach,
+                  initargs=(grid_shm.name, removal_shm.name, rows, cols)) as pool:
+            total = 0
+            active = list(range(len(bands))) # bands that have to be looked at this round
+            while active:
+                counts = pool.map(find_accessible, [bands[b] for b in active])
+                changed = [b for b, count in zip(active, counts) if count]
+                total += sum(counts)
+                if part == 1:
+                    break
+                pool.map(remove_accessible, [bands[b] for b in changed])
+
+                # a change can only make rolls accessible in the band itself and its neighbours
+                next_active = set()
+                for b in changed:
+                    next_active.update((b - 1, b, b + 1))
+                active = sorted(b for b in next_active if 0 <= b < len(bands))
+        return total
+    finally:
+        grid_shm.close()
+        grid_shm.unlink()
+        removal_shm.close()
+        removal_shm.unlink()
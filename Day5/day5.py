@@ -1,6 +1,9 @@
+import os
+from intervals import build_index, count_fresh_batch
+
 def solve_problem(fname):
     if len(fname) < 1:
-        fname = '/workspaces/AdventofCode/Day5/index.txt'
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'index.txt')
     
     fresh = 0
     spoiled = 0
@@ -23,18 +26,11 @@ def solve_problem(fname):
                 list_numbers.append(number)
 
             
-    for number in list_numbers:
-        is_fresh = False
-        for interval in list_interval:
-            if interval[0] <= number <= interval[1]:
-                is_fresh = True
-                break
-        if is_fresh:
-            fresh += 1
-        else:
-            spoiled += 1
+    starts, ends = build_index(list_interval) # sorted, merged intervals
+    fresh, spoiled = count_fresh_batch(starts, ends, list_numbers)
     
     print(f"Fresh: {fresh}, Spoiled: {spoiled}")
+    return fresh
 
 if __name__ == "__main__":
     fname = input("Enter the filename (leave blank for default): ")
@@ -1,7 +1,18 @@
-def solve_problem(fname):
+import os
+from intervals import merge_intervals, count_covered_external
+
+ENGINES = ('memory', 'external')
+
+def solve_problem(fname, engine='memory'):
     if len(fname) < 1:
-        fname = '/workspaces/AdventofCode/Day5/index.txt'
-    
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'index.txt')
+
+    if engine == 'external':
+        count = count_covered_external(fname) # sorts in bounded memory with temporary run files
+        print(f"Fresh ingredient ID count: {count}")
+        return count
+    elif engine != 'memory':
+        raise ValueError(f"Unknown engine '{engine}', choose from: {', '.join(ENGINES)}")
    
     list_interval = []
     set_numbers = set()
@@ -19,25 +30,14 @@ def solve_problem(fname):
                 continue
 
 
-        list_interval.sort(key=lambda x: x[0])  # sort intervals by start value  
-   
-        curr_start, curr_end = list_interval[0] # initialize with the first interval
-        merged_intervals = [] # list to hold merged intervals, to prevent double counting
-        for i in range(1,len(list_interval)):
-            next_start,next_end = list_interval[i]
-            if next_start <= curr_end: # there is an overlap
-                curr_end = max(curr_end, next_end) # extend the current interval
-            else:
-                merged_intervals.append((curr_start, curr_end)) # no overlap, add the current interval to the list
-                curr_start, curr_end = next_start, next_end # move to the next interval
-
-        merged_intervals.append((curr_start, curr_end)) # add the last interval
+        merged_intervals = merge_intervals(list_interval) # merged intervals, to prevent double counting
 
         count = 0
         for start, end in merged_intervals:
             count += (end - start + 1) # count all numbers in the merged intervals
     
     print(f"Fresh ingredient ID count: {count}")
+    return count
 
 if __name__ == "__main__":
     fname = input("Enter the filename (leave blank for default): ")
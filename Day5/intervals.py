@@ -0,0 +1,353 @@
+import argparse
+import bisect
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+
+# One interval in a run file of the external merge
+RUN_RECORD = struct.Struct('<qq')
+BYTES_PER_INTERVAL = 128 # rough size of a (start, end) tuple with its two ints in a list
+MAX_FAN_IN = 64 # run files merged at the same time
+
+# Header of a saved IntervalIndex: magic, number of intervals, total covered count
+HEADER = struct.Struct('<8sQQ')
+MAGIC = b'AOCIVL1\0'
+
+def merge_intervals(list_interval):
+    """
+    Sorts the intervals and merges overlapping ones, to prevent double counting.
+    param list_interval: list of (start, end) tuples, end inclusive
+    return: sorted list of disjoint (start, end) tuples
+    """
+    if not list_interval:
+        return []
+
+    list_interval = sorted(list_interval, key=lambda x: x[0])  # sort intervals by start value
+
+    curr_start, curr_end = list_interval[0] # initialize with the first interval
+    merged_intervals = []
+    for next_start, next_end in list_interval[1:]:
+        if next_start <= curr_end: # there is an overlap
+            curr_end = max(curr_end, next_end) # extend the current interval
+        else:
+            merged_intervals.append((curr_start, curr_end)) # no overlap, add the current interval to the list
+            curr_start, curr_end = next_start, next_end # move to the next interval
+
+    merged_intervals.append((curr_start, curr_end)) # add the last interval
+    return merged_intervals
+
+def build_index(list_interval):
+    """
+    Merges the intervals and splits them into parallel arrays of starts and ends.
+    Both arrays are sorted, so a lookup is a single bisect.
+    return: (starts, ends)
+    """
+    merged = merge_intervals(list_interval)
+    starts = [start for start, end in merged]
+    ends = [end for start, end in merged]
+    return starts, ends
+
+def is_fresh(starts, ends, number):
+    """
+    Checks if the number lies in one of the merged intervals. O(log M).
+    """
+    i = bisect.bisect_right(starts, number) - 1 # last interval starting at or before number
+    return i >= 0 and number <= ends[i]
+
+def count_fresh_batch(starts, ends, numbers):
+    """
+    Counts fresh and spoiled numbers with one merge-join sweep: the numbers are
+    sorted and walked together with the sorted intervals. O(N log N + M).
+    return: (fresh, spoiled)
+    """
+    fresh = 0
+    i = 0 # current interval
+    for number in sorted(numbers):
+        while i < len(ends) and ends[i] < number: # intervals that end before number are done
+            i += 1
+        if i == len(ends):
+            break # no interval left, the remaining numbers are all spoiled
+        if starts[i] <= number:
+            fresh += 1
+    return fresh, len(numbers) - fresh
+
+def read_intervals(fname):
+    """
+    Reads the "start-end" lines of a Day 5 database, ignoring the ingredient IDs.
+    """
+    list_interval = []
+    with open(fname, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if '-' in line:
+                parts = line.split('-')
+                list_interval.append((int(parts[0]), int(parts[1])))
+    return list_interval
+
+def write_run(intervals, directory, number):
+    """
+    Sorts and merges one chunk of intervals and writes it to a temporary run file.
+    """
+    fname = os.path.join(directory, f'run{number}.bin')
+    with open(fname, 'wb') as f:
+        for start, end in merge_intervals(intervals):
+            f.write(RUN_RECORD.pack(start, end))
+    return fname
+
+def read_run(fname, buffer_bytes):
+    """
+    Yields the intervals of a run file, reading buffer_bytes at a time.
+    """
+    buffer_bytes = max(RUN_RECORD.size, buffer_bytes - buffer_bytes % RUN_RECORD.size)
+    with open(fname, 'rb') as f:
+        while True:
+            block = f.read(buffer_bytes)
+            if not block:
+                return
+            yield from RUN_RECORD.iter_unpack(block)
+
+def coalesce(intervals):
+    """
+    Merges overlapping intervals of a stream that is sorted by start.
+    """
+    curr_start = curr_end = None
+    for start, end in intervals:
+        if curr_end is not None and start <= curr_end: # overlap, extend the current interval
+            curr_end = max(curr_end, end)
+        else:
+            if curr_end is not None:
+                yield curr_start, curr_end
+            curr_start, curr_end = start, end
+    if curr_end is not None:
+        yield curr_start, curr_end
+
+def merge_runs(runs, directory, buffer_bytes):
+    """
+    Merges groups of MAX_FAN_IN run files into longer runs until at most
+    MAX_FAN_IN are left, so the final merge never opens too many files.
+    """
+    while len(runs) > MAX_FAN_IN:
+        merged_runs = []
+        for i in range(0, len(runs), MAX_FAN_IN):
+            group = runs[i:i + MAX_FAN_IN]
+            fname = os.path.join(directory, f'run{len(runs)}_{i}.bin')
+            with open(fname, 'wb') as f:
+                readers = (read_run(run, buffer_bytes // len(group)) for run in group)
+                for start, end in coalesce(heapq.merge(*readers)):
+                    f.write(RUN_RECORD.pack(start, end))
+            for run in group:
+                os.remove(run)
+            merged_runs.append(fname)
+        runs = merged_runs
+    return runs
+
+def count_covered_external(fname, memory_budget=64 * 1024 * 1024):
+    """
+    Part 2 for interval files that do not fit in memory.
+    The intervals are read in chunks that fit into memory_budget, every chunk
+    is sorted, merged and written to a temporary run file, and the runs are
+    combined with a k-way heapq.merge while overlapping intervals are merged
+    and counted on the fly.
+    param fname: Day 5 database file
+    param memory_budget: bytes to use for a chunk, and for the read buffers of all runs during the merge
+    return: number of fresh IDs
+    """
+    chunk_size = max(1, memory_budget // BYTES_PER_INTERVAL)
+
+    with tempfile.TemporaryDirectory() as directory:
+        runs = []
+        chunk = []
+        with open(fname, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if '-' in line:
+                    parts = line.split('-')
+                    chunk.append((int(parts[0]), int(parts[1])))
+                    if len(chunk) == chunk_size:
+                        runs.append(write_run(chunk, directory, len(runs)))
+                        chunk = []
+
+        if runs:
+            if chunk:
+                runs.append(write_run(chunk, directory, len(runs)))
+            chunk = [] # free the last chunk before the merge
+            runs = merge_runs(runs, directory, memory_budget)
+            buffer_bytes = memory_budget // len(runs)
+            merged = heapq.merge(*(read_run(run, buffer_bytes) for run in runs))
+        else: # everything fit into one chunk
+            merged = iter(merge_intervals(chunk))
+
+        count = 0
+        for start, end in coalesce(merged):
+            count += end - start + 1
+    return count
+
+class IntervalIndex:
+    """
+    Updatable set of fresh ID ranges, kept as sorted, disjoint intervals in two
+    parallel arrays. Inserting merges with overlapping or touching intervals,
+    deleting splits intervals, and the total number of covered IDs (the part 2
+    answer) is updated with every change.
+    The index can be saved to a binary file and opened again with mmap: queries
+    run on the mapped file directly, the arrays are only copied into lists when
+    the index is changed.
+    """
+    def __init__(self, list_interval=()):
+        self.starts = []
+        self.ends = []
+        self.total = 0
+        self.mm = None
+        for start, end in merge_intervals(list(list_interval)):
+            self.insert(start, end)
+
+    @classmethod
+    def from_file(cls, fname):
+        return cls(read_intervals(fname))
+
+    def __len__(self):
+        return len(self.starts)
+
+    def intervals(self):
+        return list(zip(self.starts, self.ends))
+
+    def make_mutable(self):
+        """
+        Copies the memory mapped arrays into lists before the first change.
+        """
+        if self.mm is not None:
+            starts, ends = list(self.starts), list(self.ends)
+            self.starts.release()
+            self.ends.release()
+            self.mm.close()
+            self.mm = None
+            self.starts, self.ends = starts, ends
+
+    def insert(self, start, end):
+        """
+        Adds the range [start, end], merging it with overlapping and touching intervals.
+        """
+        if start > end:
+            raise ValueError(f'Invalid range {start}-{end}')
+        self.make_mutable()
+        i = bisect.bisect_left(self.ends, start - 1) # first interval that ends at or after start - 1
+        j = bisect.bisect_right(self.starts, end + 1) # first interval that starts after end + 1
+        if i < j: # merge with the intervals i..j-1
+            start = min(start, self.starts[i])
+            end = max(end, self.ends[j - 1])
+            self.total -= sum(self.ends[k] - self.starts[k] + 1 for k in range(i, j))
+        self.starts[i:j] = [start]
+        self.ends[i:j] = [end]
+        self.total += end - start + 1
+
+    def delete(self, start, end):
+        """
+        Removes the range [start, end], splitting intervals that stick out on either side.
+        """
+        if start > end:
+            raise ValueError(f'Invalid range {start}-{end}')
+        self.make_mutable()
+        i = bisect.bisect_left(self.ends, start) # first interval that ends at or after start
+        j = bisect.bisect_right(self.starts, end) # first interval that starts after end
+        if i >= j:
+            return # nothing overlaps
+
+        new_starts = []
+        new_ends = []
+        if self.starts[i] < start: # left part of the first interval stays
+            new_starts.append(self.starts[i])
+            new_ends.append(start - 1)
+        if self.ends[j - 1] > end: # right part of the last interval stays
+            new_starts.append(end + 1)
+            new_ends.append(self.ends[j - 1])
+
+        self.total -= sum(self.ends[k] - self.starts[k] + 1 for k in range(i, j))
+        self.total += sum(e - s + 1 for s, e in zip(new_starts, new_ends))
+        self.starts[i:j] = new_starts
+        self.ends[i:j] = new_ends
+
+    def contains(self, number):
+        return is_fresh(self.starts, self.ends, number)
+
+    def covered(self, start, end):
+        """
+        Number of IDs in [start, end] that are fresh.
+        """
+        i = bisect.bisect_left(self.ends, start)
+        j = bisect.bisect_right(self.starts, end)
+        count = 0
+        for k in range(i, j):
+            count += min(end, self.ends[k]) - max(start, self.starts[k]) + 1
+        return count
+
+    def save(self, fname):
+        """
+        Writes the index as header plus two int64 arrays.
+        """
+        tmp_name = fname + '.tmp'
+        with open(tmp_name, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, len(self.starts), self.total))
+            array('q', self.starts).tofile(f)
+            array('q', self.ends).tofile(f)
+        os.replace(tmp_name, fname)
+
+    @classmethod
+    def load(cls, fname):
+        """
+        Opens a saved index with mmap, without parsing or copying the intervals.
+        """
+        index = cls()
+        with open(fname, 'rb') as f:
+            index.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, index.total = HEADER.unpack_from(index.mm)
+        if magic != MAGIC:
+            index.mm.close()
+            raise ValueError(f'{fname} is not a saved interval index')
+        words = memoryview(index.mm)[HEADER.size:].cast('q')
+        index.starts = words[:count]
+        index.ends = words[count:2 * count]
+        return index
+
+    def close(self):
+        if self.mm is not None:
+            self.starts.release()
+            self.ends.release()
+            self.mm.close()
+            self.mm = None
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Persistent index of the Day 5 fresh ID ranges')
+    parser.add_argument('index', help='binary index file')
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help='build the index from a database text file')
+    build.add_argument('fname', nargs='?', default='', help='database file (default: index.txt)')
+    for name in ('insert', 'delete', 'covered'):
+        command = commands.add_parser(name, help=f'{name} a range')
+        command.add_argument('start', type=int)
+        command.add_argument('end', type=int)
+    contains = commands.add_parser('contains', help='check if an ID is fresh')
+    contains.add_argument('number', type=int)
+    commands.add_parser('total', help='number of fresh IDs (part 2)')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        fname = args.fname or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'index.txt')
+        index = IntervalIndex.from_file(fname)
+        index.save(args.index)
+        print(f'{len(index)} intervals, {index.total} fresh IDs')
+    else:
+        index = IntervalIndex.load(args.index)
+        if args.command in ('insert', 'delete'):
+            getattr(index, args.command)(args.start, args.end)
+            index.save(args.index)
+            print(f'{len(index)} intervals, {index.total} fresh IDs')
+        elif args.command == 'covered':
+            print(index.covered(args.start, args.end))
+        elif args.command == 'contains':
+            print('fresh' if index.contains(args.number) else 'spoiled')
+        else:
+            print(index.total)
+        index.close()
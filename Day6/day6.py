@@ -1,9 +1,93 @@
+import os
 import itertools
 
-def solve_problem(fname):
-    if len(fname) < 1:
-        fname = "/workspaces/AdventofCode/Day6/index.txt"
-    
+ENGINES = ('transpose', 'stream')
+
+class ProductTree:
+    """
+    Multiplies a stream of factors as a balanced binary tree.
+    Works like a binary counter: a new factor is a node of level 0, and two
+    nodes of the same level are multiplied into one node of the next level.
+    Only O(log n) partial products are kept, and big numbers are always
+    multiplied with numbers of similar size, which is much cheaper than
+    multiplying one growing result with every factor.
+    """
+    def __init__(self):
+        self.nodes = [] # (level, product), levels strictly decreasing
+
+    def add(self, factor):
+        level = 0
+        while self.nodes and self.nodes[-1][0] == level:
+            factor *= self.nodes.pop()[1]
+            level += 1
+        self.nodes.append((level, factor))
+
+    def result(self):
+        product = 1
+        for _, value in reversed(self.nodes): # smallest partial products first
+            product *= value
+        return product
+
+class ColumnAccumulator:
+    """
+    Running result of one worksheet column. As long as the operator is unknown
+    both the sum and the product are kept, afterwards only the one needed.
+    """
+    def __init__(self):
+        self.operator = None
+        self.count = 0
+        self.total = 0
+        self.product = ProductTree()
+
+    def add(self, number):
+        self.count += 1
+        if self.operator != '*':
+            self.total += number
+        if self.operator != '+':
+            self.product.add(number)
+
+    def set_operator(self, operator):
+        self.operator = operator
+        if operator == '+':
+            self.product = None # not needed anymore
+        elif operator == '*':
+            self.total = 0
+
+    def result(self):
+        if self.count == 0: # Skip if no valid numbers
+            return 0
+        if self.operator == '+':
+            return self.total
+        if self.operator == '*':
+            return self.product.result()
+        return 0 # Skip unknown operators
+
+def solve_stream(fname):
+    """
+    Evaluates the worksheet row by row, with one accumulator per column,
+    instead of transposing the whole sheet.
+    """
+    columns = [] # one ColumnAccumulator per column
+    with open(fname, 'r') as f:
+        for line in f:
+            parts = line.split() # Split by whitespace
+            if not parts:
+                continue
+            while len(columns) < len(parts):
+                columns.append(ColumnAccumulator())
+
+            if all(x in ('+', '*') for x in parts): # operator row
+                for column, operator in zip(columns, parts):
+                    column.set_operator(operator)
+                continue
+
+            for column, x in zip(columns, parts):
+                if x.lstrip('-').isdigit(): # Check if x is an integer
+                    column.add(int(x))
+
+    return sum(column.result() for column in columns)
+
+def solve_transpose(fname):
     with open(fname, 'r') as f:
         lines = f.readlines()
     
@@ -54,7 +138,22 @@ def solve_problem(fname):
         grand_total += col_result
 
 
+    return grand_total
+
+
+def solve_problem(fname, engine='transpose'):
+    if len(fname) < 1:
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'index.txt')
+
+    if engine == 'transpose':
+        grand_total = solve_transpose(fname)
+    elif engine == 'stream':
+        grand_total = solve_stream(fname)
+    else:
+        raise ValueError(f"Unknown engine '{engine}', choose from: {', '.join(ENGINES)}")
+
     print(f"Grand Total: {grand_total}")
+    return grand_total
     
 
 if __name__ == "__main__":
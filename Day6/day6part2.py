@@ -1,9 +1,9 @@
+import os
 import itertools
 
-def solve_problem(fname):
-    if len(fname) < 1:
-        fname = "/workspaces/AdventofCode/Day6/index.txt"
-    
+ENGINES = ('transpose', 'numpy')
+
+def solve_transpose(fname):
     with open(fname, 'r') as f: 
         lines = [line.rstrip('\n') for line in f] # remove trailing newlines
 
@@ -64,7 +64,22 @@ def solve_problem(fname):
         op_to_use = current_operator if current_operator else "+" # Default to addition if no operator found
         grand_total += calculate_block(current_block_numbers, op_to_use) # Calculate and add to grand total 
 
+    return grand_total
+
+def solve_problem(fname, engine='transpose'):
+    if len(fname) < 1:
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'index.txt')
+
+    if engine == 'transpose':
+        grand_total = solve_transpose(fname)
+    elif engine == 'numpy':
+        from sheet import solve_sheet # needs numpy, only imported when used
+        grand_total = solve_sheet(fname)
+    else:
+        raise ValueError(f"Unknown engine '{engine}', choose from: {', '.join(ENGINES)}")
+
     print(f"Grand Total: {grand_total}") # Print the final grand total
+    return grand_total
 
 if __name__ == "__main__":
     solve_problem(input("Dateiname: "))
\ No newline at end of file
@@ -0,0 +1,163 @@
+import argparse
+import math
+import mmap
+import os
+from multiprocessing import Pool
+
+import numpy as np
+
+SPACE = ord(' ')
+NEWLINE = ord('\n')
+CARRIAGE_RETURN = ord('\r')
+PLUS = ord('+')
+TIMES = ord('*')
+PARALLEL_COLUMNS = 1_000_000 # sheets wider than this are split between worker processes
+
+def line_layout(data):
+    """
+    Finds the lines of a worksheet file.
+    param data: uint8 array with the file content
+    return: (line_starts, line_lengths), without newline and carriage return
+    """
+    line_ends = np.flatnonzero(data == NEWLINE)
+    if len(line_ends) == 0 or line_ends[-1] != len(data) - 1:
+        line_ends = np.append(line_ends, len(data)) # last line without newline
+    line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+    lengths = line_ends - line_starts
+    has_cr = (lengths > 0) & (data[np.maximum(line_ends - 1, 0)] == CARRIAGE_RETURN)
+    return line_starts, lengths - has_cr
+
+def sheet_columns(data, line_starts, lengths, start, end):
+    """
+    Cuts the columns [start, end) out of the sheet as a 2D byte array.
+    Short lines are padded with spaces, like ljust in the original solution.
+    return: uint8 array of shape (lines, end - start)
+    """
+    columns = np.arange(start, end)
+    inside = columns < lengths[:, None]
+    positions = np.minimum(line_starts[:, None] + columns, len(data) - 1)
+    return np.where(inside, data[positions], SPACE).astype(np.uint8)
+
+def column_numbers(grid):
+    """
+    Reads the number of every column top to bottom, skipping non-digits.
+    The digits are folded in row by row, for all columns at once.
+    return: (values, has_digit)
+    """
+    is_digit = (grid >= ord('0')) & (grid <= ord('9'))
+    dtype = np.int64 if grid.shape[0] <= 18 else object # more rows could overflow int64
+    values = np.zeros(grid.shape[1], dtype=dtype)
+    for row, digits in zip(grid, is_digit):
+        values = np.where(digits, values * 10 + (row.astype(dtype) - ord('0')), values)
+    return values, is_digit.any(axis=0)
+
+def evaluate_blocks(grid):
+    """
+    Grand total of all problems in a grid whose first and last columns are block boundaries.
+    Blocks are separated by columns of spaces. Every non-empty column of a block
+    is one number, the last operator found in the block decides how the numbers
+    are combined (addition if there is none).
+    """
+    separator = (grid == SPACE).all(axis=0)
+    block = np.cumsum(separator) # block number of every column
+    values, has_digit = column_numbers(grid)
+
+    # operator of every block: the last one scanning columns left to right, top to bottom
+    is_operator = (grid == PLUS) | (grid == TIMES)
+    operator_columns = np.flatnonzero(is_operator.any(axis=0))
+    block_operator = np.full(int(block[-1]) + 1 if len(block) else 1, PLUS, dtype=np.uint8)
+    if len(operator_columns): # without any operator every block is added up
+        last_rows = grid.shape[0] - 1 - is_operator[::-1, operator_columns].argmax(axis=0)
+        operator_blocks = block[operator_columns]
+        last = np.append(operator_blocks[1:] != operator_blocks[:-1], True)
+        block_operator[operator_blocks[last]] = grid[last_rows[last], operator_columns[last]]
+
+    number_columns = np.flatnonzero(has_digit)
+    number_blocks = block[number_columns]
+    numbers = values[number_columns]
+    times = block_operator[number_blocks] == TIMES
+
+    grand_total = sum(numbers[~times].tolist()) # Python ints, the sum cannot overflow
+    times_blocks = number_blocks[times]
+    if len(times_blocks):
+        cuts = np.flatnonzero(times_blocks[1:] != times_blocks[:-1]) + 1
+        for factors in np.split(numbers[times], cuts):
+            grand_total += math.prod(factors.tolist())
+    return grand_total
+
+def evaluate_range(task):
+    """
+    Worker: evaluates the columns [start, end) of the sheet, which hold whole blocks.
+    param task: (fname, line_starts, lengths, start, end)
+    """
+    fname, line_starts, lengths, start, end = task
+    with open(fname, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = np.frombuffer(mm, dtype=np.uint8)
+            grid = sheet_columns(data, line_starts, lengths, start, end)
+            del data # release the buffer before the mapping is closed
+    return evaluate_blocks(grid)
+
+def split_blocks(separator, parts):
+    """
+    Splits the columns into about equal ranges that start and end at separator columns.
+    return: list of (start, end)
+    """
+    width = len(separator)
+    separators = np.flatnonzero(separator)
+    boundaries = [0]
+    for i in range(1, parts):
+        k = np.searchsorted(separators, width * i // parts) # next separator at or after the ideal cut
+        if k < len(separators) and separators[k] > boundaries[-1]:
+            boundaries.append(int(separators[k]))
+    boundaries.append(width)
+    return list(zip(boundaries, boundaries[1:]))
+
+def solve_sheet(fname, workers=None, parallel_columns=PARALLEL_COLUMNS):
+    """
+    Solves part 2 on the sheet as a 2D byte array.
+    The file is memory mapped, separator, digit and operator columns are found
+    with array operations. Sheets wider than parallel_columns are cut at
+    separator columns and the pieces are evaluated by a pool of worker processes.
+    param fname: input file path
+    param workers: number of processes (default: number of CPUs)
+    return: grand total
+    """
+    if len(fname) < 1:
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'index.txt')
+    if os.path.getsize(fname) == 0:
+        return 0
+
+    with open(fname, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = np.frombuffer(mm, dtype=np.uint8)
+            line_starts, lengths = line_layout(data)
+            width = int(lengths.max())
+            if width <= parallel_columns:
+                grid = sheet_columns(data, line_starts, lengths, 0, width)
+                del data
+                return evaluate_blocks(grid)
+
+            # only the separator columns are needed to cut the sheet
+            separator = np.ones(width, dtype=bool)
+            for start in range(0, width, parallel_columns):
+                end = min(width, start + parallel_columns)
+                separator[start:end] = (sheet_columns(data, line_starts, lengths, start, end) == SPACE).all(axis=0)
+            del data
+
+    workers = workers or os.cpu_count() or 1
+    ranges = split_blocks(separator, max(workers, math.ceil(width / parallel_columns)))
+    tasks = [(fname, line_starts, lengths, start, end) for start, end in ranges]
+    with Pool(workers) as pool:
+        return sum(pool.imap_unordered(evaluate_range, tasks))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Day 6 part 2 solver for very wide worksheets')
+    parser.add_argument('fname', nargs='?', default='', help='input file (default: index.txt)')
+    parser.add_argument('--workers', type=int, help='number of worker processes')
+    parser.add_argument('--parallel-columns', type=int, default=PARALLEL_COLUMNS,
+                        help='sheets wider than this are split between worker processes')
+    args = parser.parse_args()
+
+    print('Grand Total:', solve_sheet(args.fname, args.workers, args.parallel_columns))
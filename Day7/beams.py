@@ -0,0 +1,117 @@
+import argparse
+import os
+
+SPLITTER = ord('^')
+
+# translation table: '1' for a splitter, '0' for every other byte
+SPLITTER_BITS = bytes(ord('1') if b == SPLITTER else ord('0') for b in range(256))
+
+def manifold_rows(fname):
+    """
+    Streams the manifold from the row of the start 'S' downwards.
+    Rows above the start cannot be reached and are skipped.
+    return: generator yielding (width, start column) first, then one line per row
+    """
+    width = None
+    with open(fname, 'rb') as f:
+        for line in f:
+            line = line.rstrip(b'\r\n')
+            if width is None:
+                if not line:
+                    continue # leading empty lines
+                width = len(line)
+            start = line.find(b'S', 0, width)
+            if start >= 0:
+                break
+        else:
+            raise ValueError("Start position 'S' not found in the grid.")
+
+        yield width, start
+        for line in f:
+            line = line.rstrip(b'\r\n')
+            if not line:
+                break # end of the grid
+            yield line[:width]
+
+def splitter_mask(line):
+    """
+    Bitmask of the splitters in a row, bit 0 is the rightmost column.
+    """
+    return int(line.translate(SPLITTER_BITS), 2)
+
+def count_splits_bitmask(fname):
+    """
+    Counts the splitters hit by a beam, sweeping the manifold row by row.
+    The active beam columns are one integer bitmask: beams that meet a splitter
+    are replaced by beams in the columns left and right of it, all other beams
+    continue straight down. Beams always move down, so every row is handled once.
+    param fname: input file path
+    return: number of splitters hit
+    """
+    rows = manifold_rows(fname)
+    width, start = next(rows)
+    full = (1 << width) - 1
+    beams = 1 << (width - 1 - start)
+
+    splits = 0
+    for line in rows:
+        splitters = splitter_mask(line)
+        hits = beams & splitters
+        if hits:
+            splits += hits.bit_count()
+            beams = (beams & ~splitters) | ((hits << 1) & full) | (hits >> 1)
+    return splits
+
+def sweep_timelines(fname):
+    """
+    Pushes the number of timelines per column down the manifold, one row at a time.
+    A beam that meets a splitter continues in both neighbour columns, so its
+    timelines are added to both. Beams that leave the grid at the side keep
+    falling and stay one timeline each; they are only counted. The rows are
+    streamed, so memory is O(columns) and there is no recursion.
+    param fname: input file path
+    return: (splitters hit, number of timelines) - the answers of part 1 and part 2
+    """
+    rows = manifold_rows(fname)
+    width, start = next(rows)
+    full = (1 << width) - 1
+    beams = 1 << (width - 1 - start) # columns with at least one timeline
+    counts = [0] * width # timelines per column, indexed by bit position
+    counts[width - 1 - start] = 1
+    outside = 0 # timelines that left the grid at the side
+
+    splits = 0
+    for line in rows:
+        splitters = splitter_mask(line)
+        hits = beams & splitters
+        if not hits:
+            continue
+        splits += hits.bit_count()
+
+        beams = (beams & ~splitters) | ((hits << 1) & full) | (hits >> 1)
+
+        # take all split beams out first, a neighbour may be a splitter of the same row
+        split = []
+        while hits:
+            bit = (hits & -hits).bit_length() - 1
+            split.append((bit, counts[bit]))
+            counts[bit] = 0
+            hits &= hits - 1
+        for bit, timelines in split:
+            for target in (bit - 1, bit + 1):
+                if 0 <= target < width:
+                    counts[target] += timelines
+                else:
+                    outside += timelines
+    return splits, sum(counts) + outside
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Day 7 single pass solver for both parts')
+    parser.add_argument('fname', nargs='?', default='', help='input file (default: input.txt)')
+    args = parser.parse_args()
+
+    fname = args.fname or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+    splits, timelines = sweep_timelines(fname)
+    print(f'Number of unique splitters hit: {splits}')
+    print(f'Number of the unique timelines: {timelines}')
@@ -1,6 +1,19 @@
-def solve_problem(fname):
+import os
+
+ENGINES = ('bfs', 'bitmask', 'sweep')
+
+def solve_problem(fname, engine='bfs'):
     if len(fname) < 1:
-        fname = "/workspaces/AdventofCode/Day7/input.txt"
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+
+    if engine == 'bitmask':
+        from beams import count_splits_bitmask
+        return count_splits_bitmask(fname)
+    elif engine == 'sweep':
+        from beams import sweep_timelines
+        return sweep_timelines(fname)[0]
+    elif engine != 'bfs':
+        raise ValueError(f"Unknown engine '{engine}', choose from: {', '.join(ENGINES)}")
 
     with open(fname, 'r') as f:
         grid = [list(line) for line in f.read().strip().split('\n')] # Read grid from file
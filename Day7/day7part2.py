@@ -1,8 +1,20 @@
+import os
 from functools import lru_cache # Import lru_cache for memoization
 
-def solve_problem(fname):
+ENGINES = ('recursive', 'sweep', 'table')
+
+def solve_problem(fname, engine='recursive'):
     if len(fname) < 1:
-        fname = "/workspaces/AdventofCode/Day7/input.txt"
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+
+    if engine == 'sweep':
+        from beams import sweep_timelines
+        return sweep_timelines(fname)[1]
+    elif engine == 'table':
+        from timeline_table import TimelineTable
+        return TimelineTable.from_file(fname).part2
+    elif engine != 'recursive':
+        raise ValueError(f"Unknown engine '{engine}', choose from: {', '.join(ENGINES)}")
 
     with open(fname, 'r') as f:
         grid = [list(line) for line in f.read().strip().split('\n')] # Read grid from file
@@ -0,0 +1,151 @@
+import argparse
+import hashlib
+import os
+import re
+import struct
+
+# Header of a saved table: magic, sha256 of the input, start row, start column, width
+HEADER = struct.Struct('<8s32sQQQ')
+MAGIC = b'AOCTML1\0'
+LENGTH = struct.Struct('<Q') # byte length of every count, the counts can be huge
+SPLITTERS = re.compile(rb'\^')
+
+_tables = {} # sha256 of the input -> TimelineTable, for the grids seen in this process
+
+def read_manifold(data):
+    """
+    Splits the input into rows and finds the start 'S'.
+    return: (lines, start row, start column)
+    """
+    lines = [line.rstrip(b'\r') for line in data.strip().split(b'\n')]
+    for r, line in enumerate(lines):
+        c = line.find(b'S')
+        if c >= 0:
+            return lines, r, c
+    raise ValueError("Start position 'S' not found in the grid.")
+
+def timelines_per_column(lines, top):
+    """
+    Bottom-up pass: number of timelines of a beam entering each column of row `top`.
+    A beam below the last row is one timeline, a beam on a splitter is the sum
+    of the beams left and right of it, and a beam outside the grid falls down
+    as one timeline. Only the columns of a row with a splitter change, all
+    others are copied from the row below.
+    return: list with one count per column
+    """
+    width = len(lines[0])
+    counts = [1] * width # beams leaving the last row
+    for line in reversed(lines[top + 1:]):
+        columns = [m.start() for m in SPLITTERS.finditer(line, 0, width)]
+        if not columns:
+            continue
+        below = counts
+        counts = below.copy()
+        for c in columns:
+            left = below[c - 1] if c > 0 else 1
+            right = below[c + 1] if c + 1 < width else 1
+            counts[c] = left + right
+    return counts
+
+class TimelineTable:
+    """
+    Number of timelines for every start column of the manifold, so repeated
+    queries are O(1). Tables are cached by the sha256 of the grid, in memory and
+    in a file next to the input.
+    """
+    def __init__(self, digest, start_row, start, counts):
+        self.digest = digest
+        self.start_row = start_row # the columns are entry points on this row
+        self.start = start # column of 'S'
+        self.counts = counts
+
+    @classmethod
+    def build(cls, data):
+        lines, start_row, start = read_manifold(data)
+        return cls(hashlib.sha256(data).digest(), start_row, start, timelines_per_column(lines, start_row))
+
+    @classmethod
+    def from_file(cls, fname, save=True):
+        """
+        Returns the table of a grid file, from the memory cache, from the saved
+        table next to the input or by building (and saving) it.
+        """
+        with open(fname, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).digest()
+        if digest in _tables:
+            return _tables[digest]
+
+        table_name = default_table_path(fname)
+        table = None
+        if os.path.exists(table_name):
+            table = cls.load(table_name)
+            if table.digest != digest: # the input changed since the table was saved
+                table = None
+        if table is None:
+            table = cls.build(data)
+            if save:
+                table.save(table_name)
+
+        _tables[digest] = table
+        return table
+
+    def timelines(self, column):
+        """
+        Number of timelines of a beam entering the given column.
+        """
+        if not 0 <= column < len(self.counts):
+            return 1 # outside the grid the beam just falls down
+        return self.counts[column]
+
+    @property
+    def part2(self):
+        return self.counts[self.start]
+
+    def save(self, fname):
+        """
+        Writes the header followed by every count as length plus little-endian bytes.
+        """
+        tmp_name = fname + '.tmp'
+        with open(tmp_name, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, self.digest, self.start_row, self.start, len(self.counts)))
+            for count in self.counts:
+                raw = count.to_bytes((count.bit_length() + 7) // 8, 'little')
+                f.write(LENGTH.pack(len(raw)))
+                f.write(raw)
+        os.replace(tmp_name, fname)
+
+    @classmethod
+    def load(cls, fname):
+        with open(fname, 'rb') as f:
+            data = f.read()
+        magic, digest, start_row, start, width = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f'{fname} is not a saved timeline table')
+
+        counts = []
+        pos = HEADER.size
+        for _ in range(width):
+            (length,) = LENGTH.unpack_from(data, pos)
+            pos += LENGTH.size
+            counts.append(int.from_bytes(data[pos:pos + length], 'little'))
+            pos += length
+        return cls(digest, start_row, start, counts)
+
+
+def default_table_path(fname):
+    return fname + '.timelines'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Day 7: number of timelines for every start column')
+    parser.add_argument('fname', nargs='?', default='', help='input file (default: input.txt)')
+    parser.add_argument('-c', '--columns', type=int, nargs='*', default=[], help='start columns to look up')
+    parser.add_argument('--no-save', action='store_true', help='do not save the table next to the input')
+    args = parser.parse_args()
+
+    fname = args.fname or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+    table = TimelineTable.from_file(fname, save=not args.no_save)
+    print(f'Number of the unique timelines: {table.part2}')
+    for column in args.columns:
+        print(f'Start column {column}: {table.timelines(column)}')
@@ -1,3 +1,4 @@
+import os
 import math
 
 class UnionFind:
@@ -41,7 +42,33 @@ class UnionFind:
         else:
             return False # already connected
 
-def solve_problem(fname):
+ENGINES = ('pairs', 'kdtree')
+
+def shortest_pairs(coordinate, limit):
+    """
+    Calculates the Euclidean distance between all pairs of points,
+    sorts them and returns the `limit` shortest ones as (distance, i, j).
+    """
+    edges = [] # list to store edges (distances between points)
+    n = len(coordinate) # number of coordinates
+
+    for i in range(n): # calculate distances between all pairs
+        for j in range(i + 1, n): # avoid duplicate pairs
+            p1 = coordinate[i] # first point
+            p2 = coordinate[j] # second point
+            # Euclidean distance
+            dist = math.sqrt(((p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2) + ((p1[2] - p2[2]) ** 2)) # 3D distance
+            edges.append((dist, i, j)) # store distance and point indices
+
+    edges.sort(key=lambda x: x[0]) # sort edges by distance
+
+    if len(edges) < limit: # if there are less than 1000 edges, take all
+        limit = len(edges) # adjust limit
+
+    top_edges = edges[:limit] # take the top 1000 shortest edges
+    return top_edges
+
+def solve_problem(fname, engine='pairs'):
     """
     solve the problem by performing the following steps:
     1. read coordinates from the input file.
@@ -50,9 +77,10 @@ def solve_problem(fname):
     4. calculate the sizes of the connected components and return the product of the top
     
     :param fname: description
+    :param engine: 'pairs' sorts all pairs, 'kdtree' only searches the shortest pairs with a k-d tree
     """
     if len(fname) < 1:
-        fname = '/workspaces/AdventofCode/Day8/input.txt'
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
     
     coordinate = [] # list to store coordinates
    
@@ -68,26 +96,18 @@ def solve_problem(fname):
         print(f"Datei {fname} nicht gefunden.")
         return
 
-    edges = [] # list to store edges (distances between points)
-    n = len(coordinate) # number of coordinates
-
-    for i in range(n): # calculate distances between all pairs
-        for j in range(i + 1, n): # avoid duplicate pairs
-            p1 = coordinate[i] # first point
-            p2 = coordinate[j] # second point
-            # Euclidean distance
-            dist = math.sqrt(((p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2) + ((p1[2] - p2[2]) ** 2)) # 3D distance
-            edges.append((dist, i, j)) # store distance and point indices
-
-    edges.sort(key=lambda x: x[0]) # sort edges by distance
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}', choose from: {', '.join(ENGINES)}")
 
     # The task requires exactly 1000 pairs
     limit = 1000
-    
-    if len(edges) < limit: # if there are less than 1000 edges, take all
-        limit = len(edges) # adjust limit
+    n = len(coordinate) # number of coordinates
 
-    top_edges = edges[:limit] # take the top 1000 shortest edges
+    if engine == 'kdtree':
+        from kdtree import KDTree # needs numpy, only imported when used
+        top_edges = KDTree(coordinate).k_closest_pairs(limit) # (squared distance, i, j)
+    else:
+        top_edges = shortest_pairs(coordinate, limit)
 
     uf = UnionFind(n) # initialize Union-Find structure
    
@@ -113,6 +133,7 @@ def solve_problem(fname):
             break
 
     print("Final Result:", result)
+    return result
 
 if __name__ == "__main__":
     fname = input('Enter file name or press enter to use default: ')
@@ -1,3 +1,4 @@
+import os
 import math
 
 class UnionFind:
@@ -41,35 +42,12 @@ class UnionFind:
         else:
             return False # already connected
 
-def solve_problem(fname):
+def kruskal_last_connection(coordinate):
     """
-    solve the problem by performing the following steps:
-    1. read coordinates from the input file.
-    2. calculate the Euclidean distance between all points.
-    3. connect the points based on the shortest distances.
-    4. calculate the sizes of the connected components and return the product of the top
-    5. two X coordinates of the last two junction boxes connected.
-    6. The difference from part 1 is that we stop when all points are connected into a single group.
-    7. In the end, we multiply the X coordinates of the last two connected junction boxes.
-    
-    :param fname: description
+    Kruskal over the full sorted edge list: connects the closest pairs
+    until all points are in one group.
+    return: the last two connected elements
     """
-    if len(fname) < 1:
-        fname = '/workspaces/AdventofCode/Day8/input.txt'
-    coordinate = [] # list to store coordinates
-   
-    try:
-        with open(fname, 'r') as f:
-            lines = f.readlines() # read all lines from the file
-            for line in lines: # process each line
-                line = line.strip() # remove whitespace and newline characters
-                if not line: continue # skip empty lines
-                line = line.split(',') # split by comma
-                coordinate.append(list(map(int, line))) # convert to integers and store
-    except FileNotFoundError: 
-        print(f"Datei {fname} nicht gefunden.")
-        return
-
     edges = [] # list to store edges (distances between points)
     n = len(coordinate) # number of coordinates
 
@@ -102,6 +80,49 @@ def solve_problem(fname):
                 last_u = u
                 last_v = v
                 break
+    return last_u, last_v
+
+ENGINES = ('kruskal', 'prim', 'boruvka')
+
+def solve_problem(fname, engine='kruskal'):
+    """
+    solve the problem by performing the following steps:
+    1. read coordinates from the input file.
+    2. calculate the Euclidean distance between all points.
+    3. connect the points based on the shortest distances.
+    4. calculate the sizes of the connected components and return the product of the top
+    5. two X coordinates of the last two junction boxes connected.
+    6. The difference from part 1 is that we stop when all points are connected into a single group.
+    7. In the end, we multiply the X coordinates of the last two connected junction boxes.
+    
+    :param fname: description
+    :param engine: 'kruskal' sorts all edges, 'prim' and 'boruvka' build the MST without an edge list (see mst.py)
+    """
+    if len(fname) < 1:
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+    coordinate = [] # list to store coordinates
+   
+    try:
+        with open(fname, 'r') as f:
+            lines = f.readlines() # read all lines from the file
+            for line in lines: # process each line
+                line = line.strip() # remove whitespace and newline characters
+                if not line: continue # skip empty lines
+                line = line.split(',') # split by comma
+                coordinate.append(list(map(int, line))) # convert to integers and store
+    except FileNotFoundError: 
+        print(f"Datei {fname} nicht gefunden.")
+        return
+
+    if engine == 'kruskal':
+        last_u, last_v = kruskal_last_connection(coordinate)
+    elif engine in ('prim', 'boruvka'):
+        import numpy as np # only imported here, so the kruskal engine does not pay for numpy
+        from mst import last_connection
+        last = last_connection(np.array(coordinate, dtype=np.int64).reshape(-1, 3), engine)
+        last_u, last_v = last if last else (-1, -1)
+    else:
+        raise ValueError(f"Unknown engine '{engine}', choose from: {', '.join(ENGINES)}")
 
     # Calculate result
     # "What do you get if you multiply together the X coordinates 
@@ -116,6 +137,7 @@ def solve_problem(fname):
     result = x1 * x2 # multiply X coordinates
     
     print("Final Result:", result)
+    return result
 
 if __name__ == "__main__":
     fname = input('Enter file name or press enter to use default: ')
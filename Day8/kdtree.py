@@ -0,0 +1,202 @@
+import heapq
+
+import numpy as np
+
+LEAF_SIZE = 32 # points per leaf, distances inside and between leaves are computed vectorized
+UNREACHED = np.iinfo(np.int64).max # distance marker for "no point found"
+
+class KDTree:
+    """
+    k-d tree over integer 3D points, stored as flat arrays.
+    The points are reordered so that every node covers a contiguous range
+    [start, end) of self.points; self.order maps back to the input index.
+    All distances are squared integer distances, so coordinates must stay
+    below about 10^9 for the squares to fit into int64.
+    """
+    def __init__(self, points, leaf_size=LEAF_SIZE):
+        points = np.asarray(points, dtype=np.int64)
+        self.order = np.arange(len(points))
+        self.start, self.end = [], []
+        self.left, self.right = [], [] # child node ids, -1 for a leaf
+        lo, hi = [], [] # bounding box of every node
+
+        stack = [(0, len(points), None, None)] if len(points) else [] # range, parent, is left child
+        while stack:
+            start, end, parent, is_left = stack.pop()
+            node = len(self.start)
+            if parent is not None:
+                (self.left if is_left else self.right)[parent] = node
+
+            box = points[self.order[start:end]]
+            lo.append(box.min(axis=0))
+            hi.append(box.max(axis=0))
+            self.start.append(start)
+            self.end.append(end)
+            self.left.append(-1)
+            self.right.append(-1)
+            if end - start <= leaf_size:
+                continue
+
+            # split at the median of the widest dimension
+            axis = int(np.argmax(hi[-1] - lo[-1]))
+            middle = (end - start) // 2
+            part = np.argpartition(box[:, axis], middle)
+            self.order[start:end] = self.order[start:end][part]
+            stack.append((start + middle, end, node, False))
+            stack.append((start, start + middle, node, True))
+
+        self.points = points[self.order]
+        self.lo = [box.tolist() for box in lo] # plain lists, the traversal is in Python
+        self.hi = [box.tolist() for box in hi]
+
+    def __len__(self):
+        return len(self.order)
+
+    def is_leaf(self, node):
+        return self.left[node] < 0
+
+    def size(self, node):
+        return self.end[node] - self.start[node]
+
+    def box_distance2(self, a, b):
+        """
+        Smallest squared distance between any two points of the boxes of nodes a and b.
+        """
+        total = 0
+        for lo_a, hi_a, lo_b, hi_b in zip(self.lo[a], self.hi[a], self.lo[b], self.hi[b]):
+            gap = max(lo_a - hi_b, lo_b - hi_a, 0)
+            total += gap * gap
+        return total
+
+    def leaf_distances(self, a, b):
+        """
+        Squared distances between the points of leaf a (rows) and leaf b (columns).
+        """
+        pa = self.points[self.start[a]:self.end[a]]
+        pb = self.points[self.start[b]:self.end[b]]
+        diff = pa[:, None, :] - pb[None, :, :]
+        return (diff * diff).sum(axis=2)
+
+    def k_closest_pairs(self, k):
+        """
+        The k pairs with the smallest distance, like sorting all n(n-1)/2 pairs
+        by (distance, i, j) and taking the first k, with O(n + k) memory.
+        Pairs of nodes are visited closest first, starting with the pairs inside
+        a leaf, and skipped as soon as their boxes are farther apart than the
+        k-th best pair found so far, which is kept in a bounded max-heap.
+        param k: number of pairs
+        return: sorted list of (squared distance, i, j) with i < j (input indices)
+        """
+        heap = [] # max-heap of the best pairs, stored as (-d2, -i, -j)
+        if k <= 0 or len(self) < 2:
+            return []
+
+        def bound():
+            return -heap[0][0] if len(heap) >= k else None
+
+        stack = [(0, 0)]
+        while stack:
+            a, b = stack.pop()
+            limit = bound()
+            if limit is not None and self.box_distance2(a, b) > limit:
+                continue # no pair of these boxes can beat the k-th best
+
+            if self.is_leaf(a) and self.is_leaf(b):
+                d2 = self.leaf_distances(a, b)
+                pairs = np.ones_like(d2, dtype=bool)
+                rows, cols = np.nonzero(np.triu(pairs, 1) if a == b else pairs) # a point is not paired with itself
+                values = d2[rows, cols]
+                if limit is not None:
+                    keep = values <= limit
+                    rows, cols, values = rows[keep], cols[keep], values[keep]
+                i = self.order[self.start[a] + rows]
+                j = self.order[self.start[b] + cols]
+                for d, u, v in zip(values.tolist(), np.minimum(i, j).tolist(), np.maximum(i, j).tolist()):
+                    item = (-d, -u, -v)
+                    if len(heap) < k:
+                        heapq.heappush(heap, item)
+                    elif item > heap[0]: # (d, u, v) is smaller than the worst pair kept
+                        heapq.heapreplace(heap, item)
+                continue
+
+            if a == b:
+                left, right = self.left[a], self.right[a]
+                # pushed last = visited first: the pairs inside the children seed the heap
+                stack.append((left, right))
+                stack.append((right, right))
+                stack.append((left, left))
+                continue
+
+            # split the larger node, visit the closer child pair first
+            if self.is_leaf(b) or (not self.is_leaf(a) and self.size(a) >= self.size(b)):
+                pairs = [(self.left[a], b), (self.right[a], b)]
+            else:
+                pairs = [(a, self.left[b]), (a, self.right[b])]
+            pairs.sort(key=lambda pair: self.box_distance2(*pair), reverse=True)
+            stack.extend(pairs)
+
+        return sorted((-d, -u, -v) for d, u, v in heap)
+
+    def nearest_other_label(self, labels):
+        """
+        Finds for every point the closest point with a different label, e.g. the
+        closest point outside its own component. Ties are broken by the pair
+        (min index, max index), so the chosen edges follow one total order.
+        Every leaf searches the tree with the largest distance found so far for
+        its points as bound; subtrees whose points all carry the leaf's label
+        are skipped.
+        param labels: int array with the label of every input point
+        return: (d2, partner) arrays indexed like the input, partner -1 if all labels are equal
+        """
+        n = len(self)
+        label = np.asarray(labels, dtype=np.int64)[self.order] # in tree order
+        node_label = [] # label shared by all points of a node, -1 if mixed
+        for start, end in zip(self.start, self.end):
+            low, high = label[start:end].min(), label[start:end].max()
+            node_label.append(int(low) if low == high else -1)
+
+        best_d2 = np.full(n, UNREACHED, dtype=np.int64)
+        best_code = np.full(n, UNREACHED, dtype=np.int64) # min * n + max of the best pair
+        leaves = [node for node in range(len(self.start)) if self.is_leaf(node)]
+
+        for q in leaves:
+            qs, qe = self.start[q], self.end[q]
+            q_index = self.order[qs:qe]
+            limit = UNREACHED
+            stack = [0]
+            while stack:
+                node = stack.pop()
+                if node_label[q] >= 0 and node_label[node] == node_label[q]:
+                    continue # only points of the same component below
+                if self.box_distance2(q, node) > limit:
+                    continue
+
+                if not self.is_leaf(node):
+                    children = [self.left[node], self.right[node]]
+                    children.sort(key=lambda child: self.box_distance2(q, child), reverse=True)
+                    stack.extend(children) # the closer child is visited first
+                    continue
+
+                ts, te = self.start[node], self.end[node]
+                d2 = self.leaf_distances(q, node)
+                d2[label[qs:qe, None] == label[None, ts:te]] = UNREACHED # also excludes the point itself
+                t_index = self.order[ts:te]
+                code = np.minimum(q_index[:, None], t_index[None, :]) * n + np.maximum(q_index[:, None], t_index[None, :])
+
+                nearest = d2.min(axis=1)
+                nearest_code = np.where(d2 == nearest[:, None], code, UNREACHED).min(axis=1)
+                better = (nearest < best_d2[qs:qe]) | ((nearest == best_d2[qs:qe]) & (nearest_code < best_code[qs:qe]))
+                better &= nearest < UNREACHED
+                best_d2[qs:qe][better] = nearest[better]
+                best_code[qs:qe][better] = nearest_code[better]
+                limit = int(best_d2[qs:qe].max())
+
+        # back to input order, the partner is the other end of the best pair
+        d2 = np.empty(n, dtype=np.int64)
+        code = np.empty(n, dtype=np.int64)
+        d2[self.order] = best_d2
+        code[self.order] = best_code
+        index = np.arange(n)
+        low, high = code // n, code % n
+        partner = np.where(code == UNREACHED, -1, np.where(low == index, high, low))
+        return d2, partner
@@ -0,0 +1,136 @@
+import argparse
+import os
+
+import numpy as np
+
+from kdtree import KDTree, UNREACHED
+
+METHODS = ('prim', 'boruvka')
+
+def read_points(fname):
+    """
+    Reads the junction boxes "x,y,z", one per line.
+    return: int64 array of shape (n, 3)
+    """
+    with open(fname) as f:
+        points = [list(map(int, line.split(','))) for line in f if line.strip()]
+    return np.array(points, dtype=np.int64).reshape(-1, 3)
+
+def prim_mst(points):
+    """
+    Dense Prim's algorithm: O(n^2) time, but only O(n) arrays and no edge list.
+    Every step adds the closest point outside the tree and updates the distance
+    of all other points to the tree with one vectorized pass. Ties are broken
+    by the pair (min index, max index), like the stable sort of the edge list.
+    param points: int64 array of shape (n, 3)
+    return: MST edges (squared distance, i, j) with i < j, sorted
+    """
+    n = len(points)
+    if n < 2:
+        return []
+
+    index = np.arange(n)
+    in_tree = np.zeros(n, dtype=bool)
+    best_d2 = np.full(n, UNREACHED, dtype=np.int64) # distance to the tree
+    best_low = np.full(n, n, dtype=np.int64) # the edge to the tree as (low, high) pair
+    best_high = np.full(n, n, dtype=np.int64)
+
+    edges = []
+    current = 0
+    in_tree[current] = True
+    for _ in range(n - 1):
+        diff = points - points[current]
+        d2 = (diff * diff).sum(axis=1)
+        low, high = np.minimum(index, current), np.maximum(index, current)
+        better = (d2 < best_d2) | ((d2 == best_d2) & ((low < best_low) | ((low == best_low) & (high < best_high))))
+        better &= ~in_tree
+        best_d2[better] = d2[better]
+        best_low[better] = low[better]
+        best_high[better] = high[better]
+
+        # closest point outside the tree, ties by the pair
+        outside = np.where(in_tree, UNREACHED, best_d2)
+        candidates = np.flatnonzero(outside == outside.min())
+        if len(candidates) > 1:
+            candidates = candidates[np.lexsort((best_high[candidates], best_low[candidates]))]
+        current = int(candidates[0])
+
+        in_tree[current] = True
+        edges.append((int(best_d2[current]), int(best_low[current]), int(best_high[current])))
+    return sorted(edges)
+
+def find(parent, p):
+    while parent[p] != p:
+        parent[p] = parent[parent[p]] # path halving
+        p = parent[p]
+    return p
+
+def boruvka_mst(points):
+    """
+    Borůvka's algorithm over a k-d tree, for inputs too large for O(n^2).
+    Every round finds the shortest edge leaving each component with a tree
+    search per leaf and adds all of them, so there are at most log2(n) rounds.
+    param points: int64 array of shape (n, 3)
+    return: MST edges (squared distance, i, j) with i < j, sorted
+    """
+    n = len(points)
+    if n < 2:
+        return []
+
+    tree = KDTree(points)
+    parent = list(range(n))
+    labels = np.arange(n)
+    edges = []
+    while len(edges) < n - 1:
+        d2, partner = tree.nearest_other_label(labels)
+        low, high = np.minimum(np.arange(n), partner), np.maximum(np.arange(n), partner)
+
+        # shortest edge of every component: first point after sorting by label, d2, pair
+        order = np.lexsort((high, low, d2, labels))
+        first = order[np.append(True, labels[order][1:] != labels[order][:-1])]
+        for d, u, v in sorted(zip(d2[first].tolist(), low[first].tolist(), high[first].tolist())):
+            root_u, root_v = find(parent, u), find(parent, v)
+            if root_u != root_v: # two components can pick the same edge
+                parent[root_u] = root_v
+                edges.append((d, u, v))
+
+        labels = np.array([find(parent, p) for p in range(n)])
+    return sorted(edges)
+
+def mst_edges(points, method='prim'):
+    """
+    Edges of the minimum spanning tree. Kruskal would add exactly these edges
+    in this order, so the last one is the pair that joins everything into one group.
+    """
+    if method == 'prim':
+        return prim_mst(points)
+    elif method == 'boruvka':
+        return boruvka_mst(points)
+    raise ValueError(f"Unknown method '{method}', choose from: {', '.join(METHODS)}")
+
+def last_connection(points, method='prim'):
+    """
+    The last two junction boxes connected, i.e. the longest MST edge.
+    return: (i, j), or None if there are less than two boxes
+    """
+    edges = mst_edges(points, method)
+    return edges[-1][1:] if edges else None
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Day 8 part 2 with a minimum spanning tree, without an edge list')
+    parser.add_argument('fname', nargs='?', default='', help='input file (default: input.txt)')
+    parser.add_argument('--method', choices=METHODS, default='prim', help='prim: O(n^2) dense, boruvka: k-d tree for large n')
+    parser.add_argument('--edges', action='store_true', help='also print all MST edges')
+    args = parser.parse_args()
+
+    fname = args.fname or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+    points = read_points(fname)
+    edges = mst_edges(points, args.method)
+    if args.edges:
+        for d2, i, j in edges:
+            print(f'{i} {j} {d2}')
+    if edges:
+        i, j = edges[-1][1:]
+        print(f'Last connection: {i} {j}')
+        print('Final Result:', points[i][0] * points[j][0])
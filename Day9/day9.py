@@ -1,6 +1,8 @@
+import os
+
 def solve_problem(fname):
     if len(fname) < 1:
-        fname = "/workspaces/AdventofCode/Day9/input.txt"
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
 
     coordinates = list() # list of (x,y) tuples
     with open(fname,'r') as f:
@@ -29,6 +31,7 @@ def solve_problem(fname):
     
 
     print(f'Result is : {max_area} and pair : {best_pair}')
+    return max_area
 
 if __name__ == "__main__":
     fname = input('Enter file name or press enter to use default: ')
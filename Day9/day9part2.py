@@ -1,6 +1,8 @@
+import os
+
 def solve_problem(fname):
     if len(fname) < 1:
-        fname = '/workspaces/AdventofCode/Day9/input.txt'
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
 
     coordinates = list() # list of (x,y) tuples
     with open(fname,'r') as f:
@@ -108,6 +110,7 @@ def solve_problem(fname):
     print(f"Valid maximum area: {max_area}")
     print(f"Between pair: {best_pair}")
     print("-" * 30)
+    return max_area
 
 if __name__ == "__main__":
     fname = input('Enter file name (or press Enter for default): ')
@@ -0,0 +1,212 @@
+"""
+Unified runner for all Advent of Code solutions in this repository.
+
+Every day lives in its own "DayN" folder with one script per part
+(dayN.py for part 1, dayN_part2.py or dayNpart2.py for part 2).
+A script that solves the other part declares it with "SOLVES_PART = 2"
+(Day10/day10.py is a second part 2 solution, so Day10 has no part 1).
+The runner only reads the files to discover what exists and imports a
+solution module when that part is actually selected, so heavy imports
+like numpy are only paid when they are needed.
+
+Usage:
+    python aoc.py list
+    python aoc.py run            # all days, all parts
+    python aoc.py run 3          # both parts of day 3
+    python aoc.py run 3 2        # day 3, part 2
+    python aoc.py run 3 2 --input my_input.txt
+    python aoc.py run 4 1 --engine numpy
+"""
+import argparse
+import importlib.util
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+DAY_DIR_PATTERN = re.compile(r'^Day(\d+)$')
+PART_FILE_PATTERN = re.compile(r'^day(\d+)(_?part2)?\.py$')
+# A script can override the part given by its file name with a line "SOLVES_PART = 2"
+PART_DECLARATION = re.compile(rb'^SOLVES_PART\s*=\s*([12])\b', re.MULTILINE)
+
+
+def declared_part(path):
+    """
+    Reads the part a script declares with SOLVES_PART, without importing it.
+    return: 1, 2 or None if the script does not declare one
+    """
+    with open(path, 'rb') as f:
+        match = PART_DECLARATION.search(f.read())
+    return int(match.group(1)) if match else None
+
+
+def discover_solutions(root=ROOT):
+    """
+    Finds all solution scripts without importing them.
+    The part is taken from the file name unless the script declares another
+    one with SOLVES_PART. If two scripts solve the same part, the one whose
+    file name matches the part is used.
+    param root: repository root containing the DayN folders
+    return: dict mapping (day, part) -> path of the solution script
+    """
+    solutions = {}
+    declared = {} # (day, part) -> path, for scripts whose declaration differs from the file name
+    for entry in os.scandir(root):
+        match = DAY_DIR_PATTERN.match(entry.name)
+        if not entry.is_dir() or not match:
+            continue
+        day = int(match.group(1))
+        for script in os.scandir(entry.path):
+            script_match = PART_FILE_PATTERN.match(script.name)
+            if not script_match or int(script_match.group(1)) != day:
+                continue
+            part = 2 if script_match.group(2) else 1
+            declaration = declared_part(script.path)
+            if declaration is not None and declaration != part:
+                declared[(day, declaration)] = script.path
+            else:
+                solutions[(day, part)] = script.path
+
+    for key, path in declared.items():
+        solutions.setdefault(key, path)
+    return solutions
+
+
+def load_solution(path, day, part):
+    """
+    Imports a single solution script by its path.
+    The day folder is put on sys.path so that helper modules living next to
+    the script can be imported the same way as when the script is run directly.
+    param path: path of the solution script
+    return: the imported module
+    """
+    day_dir = os.path.dirname(path)
+    if day_dir not in sys.path:
+        sys.path.insert(0, day_dir)
+
+    spec = importlib.util.spec_from_file_location(f'day{day}_part{part}', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_entry_point(module):
+    """
+    Returns the function that solves a whole input file.
+    Most scripts expose solve_problem(fname); scripts whose solve_problem works
+    on already parsed data expose solve_file(fname) instead.
+    """
+    if hasattr(module, 'solve_file'):
+        return module.solve_file
+    return module.solve_problem
+
+
+class EngineNotAvailable(ValueError):
+    """
+    The selected part does not offer the requested engine.
+    """
+
+
+def run_part(path, day, part, fname='', engine=None):
+    """
+    Imports and runs one part, measuring import and solve time separately.
+    param engine: name of an alternative implementation, for solutions that offer several
+    return: (result, import_seconds, solve_seconds)
+    """
+    start = time.perf_counter()
+    module = load_solution(path, day, part)
+    imported = time.perf_counter()
+    if engine is None:
+        result = get_entry_point(module)(fname)
+    elif engine in getattr(module, 'ENGINES', ()):
+        result = get_entry_point(module)(fname, engine=engine)
+    elif hasattr(module, 'ENGINES'):
+        raise EngineNotAvailable(f"Day {day} part {part} has no engine '{engine}', "
+                                 f"choose from: {', '.join(module.ENGINES)}")
+    else:
+        raise EngineNotAvailable(f'Day {day} part {part} has no alternative engines')
+    solved = time.perf_counter()
+    return result, imported - start, solved - imported
+
+
+def select(solutions, day=None, part=None):
+    """
+    Filters the discovered solutions by day and part, sorted by day and part.
+    """
+    selected = []
+    for key in sorted(solutions):
+        if day is not None and key[0] != day:
+            continue
+        if part is not None and key[1] != part:
+            continue
+        selected.append(key)
+    return selected
+
+
+def cmd_list(args):
+    solutions = discover_solutions()
+    for day, part in select(solutions):
+        print(f'Day {day:2d} part {part}: {os.path.relpath(solutions[(day, part)], ROOT)}')
+
+
+def cmd_run(args):
+    solutions = discover_solutions()
+    selected = select(solutions, args.day, args.part)
+    if not selected:
+        print('No solution found for the given day/part.')
+        return 1
+
+    fname = args.input if args.input else ''
+    ran = 0
+    failed = []
+    for day, part in selected:
+        print(f'--- Day {day} part {part} ---')
+        try:
+            result, import_time, solve_time = run_part(solutions[(day, part)], day, part, fname, args.engine)
+        except EngineNotAvailable as error: # skip parts without the engine, run the others
+            print(f'Skipped: {error}')
+            continue
+        except Exception as error: # e.g. a missing dependency, the other parts still run
+            print(f'Day {day} part {part} failed: {type(error).__name__}: {error}')
+            failed.append((day, part))
+            continue
+        ran += 1
+        print(f'Day {day} part {part}: {result} '
+              f'(import {import_time * 1000:.1f} ms, solve {solve_time * 1000:.1f} ms)')
+
+    if failed:
+        print('Failed: ' + ', '.join(f'day {day} part {part}' for day, part in failed))
+        return 1
+    if not ran:
+        print(f"No selected solution offers the engine '{args.engine}'.")
+        return 1
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='aoc', description='Advent of Code solution runner')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = commands.add_parser('list', help='list all discovered days and parts')
+    list_parser.set_defaults(func=cmd_list)
+
+    run_parser = commands.add_parser('run', help='run one or more solutions')
+    run_parser.add_argument('day', type=int, nargs='?', help='day to run (default: all)')
+    run_parser.add_argument('part', type=int, nargs='?', choices=(1, 2), help='part to run (default: both)')
+    run_parser.add_argument('--input', help='input file (default: the input file of the day)')
+    run_parser.add_argument('--engine', help='alternative implementation, for days that offer several (e.g. day 4); '
+                                                 'parts without it are skipped')
+    run_parser.set_defaults(func=cmd_run)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
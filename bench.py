@@ -0,0 +1,208 @@
+"""
+Scaling benchmarks for all solutions.
+
+For every selected day, part and size factor a synthetic input is generated
+with generators.py (cached in bench_inputs/), the solution is run in a fresh
+Python process and its wall time and peak memory are recorded. The results
+are written to a JSON file and compared against a stored baseline.
+
+Usage:
+    python bench.py                          # all days, sizes 1 and 10
+    python bench.py 4 --sizes 1 10 100 1000  # day 4, both parts
+    python bench.py 3 2 --save-baseline      # store results as new baseline
+    python bench.py 4 1 --sizes 100 --engine loop numpy
+"""
+import argparse
+import contextlib
+import json
+import os
+import subprocess
+import sys
+
+import aoc
+import generators
+
+try:
+    import resource
+except ImportError: # not available on Windows
+    resource = None
+
+INPUT_DIR = os.path.join(aoc.ROOT, 'bench_inputs')
+RESULTS_FILE = os.path.join(aoc.ROOT, 'bench_results.json')
+BASELINE_FILE = os.path.join(aoc.ROOT, 'bench_baseline.json')
+
+
+def input_file(day, size, seed):
+    """
+    Returns the path of the generated input, generating it if needed.
+    """
+    os.makedirs(INPUT_DIR, exist_ok=True)
+    fname = os.path.join(INPUT_DIR, f'day{day}_x{size}_seed{seed}_v{generators.version(day)}.txt')
+    if not os.path.exists(fname):
+        text = generators.generate(day, size, seed)
+        with open(fname + '.tmp', 'w') as f:
+            f.write(text)
+        os.replace(fname + '.tmp', fname)
+    return fname
+
+
+def measure(day, part, fname, engine=None):
+    """
+    Runs a single solution in this process and returns the measurement.
+    Called in a child process, so the peak memory belongs to this run only.
+    """
+    solutions = aoc.discover_solutions()
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            result, import_time, solve_time = aoc.run_part(solutions[(day, part)], day, part, fname, engine)
+    except aoc.EngineNotAvailable as error: # like aoc.py run: parts without the engine are skipped
+        return {'skipped': str(error)}
+
+    peak_kib = None
+    if resource is not None:
+        peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == 'darwin': # macOS reports bytes instead of KiB
+            peak_kib //= 1024
+    return {
+        'result': str(result),
+        'import_seconds': import_time,
+        'seconds': solve_time,
+        'peak_kib': peak_kib,
+    }
+
+
+def run_measurement(day, part, fname, timeout, engine=None):
+    """
+    Runs measure() in a fresh interpreter.
+    return: measurement dict, with 'error' set on timeout or failure and
+            'skipped' set if the part does not offer the engine
+    """
+    command = [sys.executable, os.path.abspath(__file__), '_measure', str(day), str(part), fname]
+    if engine is not None:
+        command.append(engine)
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {'error': f'timeout after {timeout}s'}
+
+    if completed.returncode != 0:
+        lines = completed.stderr.strip().splitlines()
+        return {'error': lines[-1] if lines else f'exit code {completed.returncode}'}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def result_key(day, part, size, engine=None):
+    """
+    Key of a measurement; contains the generator version, so results of
+    different generated inputs are never compared.
+    """
+    key = f'day{day}/part{part}/x{size}/v{generators.version(day)}'
+    if engine is not None:
+        key += f'/{engine}'
+    return key
+
+
+def find_regressions(results, baseline, threshold):
+    """
+    Compares the results with the baseline.
+    A run is a regression if it got slower than baseline * (1 + threshold),
+    failed while the baseline run did not, or produced a different answer.
+    return: list of (key, reason)
+    """
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None or 'error' in previous:
+            continue
+        if 'error' in current:
+            regressions.append((key, current['error']))
+        elif current['result'] != previous['result']:
+            regressions.append((key, f"result changed from {previous['result']} to {current['result']}"))
+        elif current['seconds'] > previous['seconds'] * (1 + threshold):
+            regressions.append((key, f"{previous['seconds']:.3f}s -> {current['seconds']:.3f}s"))
+    return regressions
+
+
+def load_json(fname):
+    if not os.path.exists(fname):
+        return {}
+    with open(fname) as f:
+        return json.load(f)
+
+
+def save_json(fname, data):
+    with open(fname, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def cmd_bench(args):
+    solutions = aoc.discover_solutions()
+    selected = aoc.select(solutions, args.day, args.part)
+    if not selected:
+        print('No solution found for the given day/part.')
+        return 1
+
+    results = {}
+    for day, part in selected:
+        for size in args.sizes:
+            fname = input_file(day, size, args.seed)
+            for engine in args.engine or [None]:
+                measurement = run_measurement(day, part, fname, args.timeout, engine)
+                key = result_key(day, part, size, engine)
+                if 'skipped' in measurement:
+                    print(f'{key:36s} skipped: {measurement["skipped"]}')
+                    continue
+                results[key] = measurement
+
+                if 'error' in measurement:
+                    print(f'{key:36s} {measurement["error"]}')
+                else:
+                    peak = measurement['peak_kib']
+                    peak_text = f'{peak / 1024:8.1f} MiB' if peak is not None else '       n/a'
+                    print(f'{key:36s} {measurement["seconds"]:10.3f}s {peak_text}')
+
+    save_json(args.output, results)
+    print(f'Results written to {args.output}')
+
+    if args.save_baseline:
+        baseline = load_json(args.baseline)
+        baseline.update(results)
+        save_json(args.baseline, baseline)
+        print(f'Baseline updated in {args.baseline}')
+        return 0
+
+    regressions = find_regressions(results, load_json(args.baseline), args.threshold)
+    for key, reason in regressions:
+        print(f'REGRESSION {key}: {reason}')
+    return 1 if regressions else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Scaling benchmarks for the Advent of Code solutions')
+    parser.add_argument('day', type=int, nargs='?', help='day to benchmark (default: all)')
+    parser.add_argument('part', type=int, nargs='?', choices=(1, 2), help='part to benchmark (default: both)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 10], help='input size factors (default: 1 10)')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the input generators')
+    parser.add_argument('--engine', nargs='+', help='alternative implementations to compare, for days that offer several')
+    parser.add_argument('--timeout', type=float, default=300, help='seconds before a run is aborted')
+    parser.add_argument('--output', default=RESULTS_FILE, help='where to write the results')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='baseline to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed slowdown against the baseline (default: 0.25 = 25%%)')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the new baseline')
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == '_measure': # internal: run inside the child process
+        day, part, fname = int(argv[1]), int(argv[2]), argv[3]
+        engine = argv[4] if len(argv) > 4 else None
+        print(json.dumps(measure(day, part, fname, engine)))
+        return 0
+    return cmd_bench(build_parser().parse_args(argv))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
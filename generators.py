@@ -0,0 +1,335 @@
+"""
+Deterministic synthetic input generators for every day.
+
+Each generator takes a size factor (1 produces an input roughly as large as
+the real puzzle input, 10 ten times as many lines/cells/points, ...) and a
+seed, and returns the input file content as a string. The same
+(day, size, seed) always produces the same text for a given generator
+version; a generator whose output changes gets a new entry in VERSIONS, so
+cached inputs and benchmark baselines of the old output are not reused.
+"""
+import math
+import random
+import string
+
+
+def make_rng(day, size, seed):
+    """
+    Creates a random generator that only depends on day, size and seed.
+    A string seed is hashed with sha512 by random, so it does not depend on
+    PYTHONHASHSEED.
+    """
+    return random.Random(f'{seed}-{day}-{size}')
+
+
+def grid_side(base_side, size):
+    """
+    Side length of a square grid with size times the cells of a base_side grid.
+    """
+    return max(3, round(base_side * math.sqrt(size)))
+
+
+def node_names(count, rng):
+    """
+    Creates count distinct lowercase node names, at least 3 letters long,
+    in random order.
+    """
+    width = 3
+    while 26 ** width < count + 5:
+        width += 1
+    names = set()
+    while len(names) < count:
+        name = ''.join(rng.choice(string.ascii_lowercase) for _ in range(width))
+        if name not in ('you', 'out', 'svr', 'dac', 'fft'):
+            names.add(name)
+    names = sorted(names)
+    rng.shuffle(names)
+    return names
+
+
+def present_area(counts, shape_cells):
+    """
+    Total number of cells covered by the given number of presents of every shape.
+    """
+    return sum(count * cells for count, cells in zip(counts, shape_cells))
+
+
+def generate_day1(size, seed=0):
+    """
+    Rotation instructions like "R34" or "L715", one per line.
+    """
+    rng = make_rng(1, size, seed)
+    lines = []
+    for _ in range(4000 * size):
+        lines.append(f"{rng.choice('LR')}{rng.randint(1, 999)}")
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day2(size, seed=0):
+    """
+    One line of comma separated ID ranges like "7272640820-7272795557".
+    """
+    rng = make_rng(2, size, seed)
+    ranges = []
+    for _ in range(35 * size):
+        digits = rng.randint(1, 10)
+        start = rng.randint(10 ** (digits - 1), 10 ** digits - 1)
+        end = start + rng.randint(0, 10 ** min(digits - 1, 5))
+        ranges.append(f'{start}-{end}')
+    return ','.join(ranges) + '\n'
+
+
+def generate_day3(size, seed=0):
+    """
+    Battery banks: lines of 100 digits between 1 and 9.
+    """
+    rng = make_rng(3, size, seed)
+    lines = []
+    for _ in range(200 * size):
+        lines.append(''.join(rng.choice('123456789') for _ in range(100)))
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day4(size, seed=0):
+    """
+    Square grid of paper rolls '@' and empty cells '.'.
+    """
+    rng = make_rng(4, size, seed)
+    side = grid_side(140, size)
+    lines = []
+    for _ in range(side):
+        lines.append(''.join(rng.choices('@.', weights=(62, 38), k=side)))
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day5(size, seed=0):
+    """
+    Fresh ingredient ID ranges, a blank line and the available ingredient IDs.
+    """
+    rng = make_rng(5, size, seed)
+    top = 560_000_000_000_000
+    lines = []
+    for _ in range(186 * size):
+        start = rng.randint(1, top)
+        lines.append(f'{start}-{start + rng.randint(0, top // 100)}')
+    lines.append('')
+    for _ in range(1000 * size):
+        lines.append(str(rng.randint(1, top)))
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day6(size, seed=0):
+    """
+    Worksheet with four rows of numbers and an operator row. Every problem is a
+    block of columns, separated by a column of spaces, with the numbers
+    aligned either left or right inside the block.
+    """
+    rng = make_rng(6, size, seed)
+    rows = [[] for _ in range(5)]
+    for _ in range(1000 * size):
+        numbers = [str(rng.randint(1, 10 ** rng.randint(1, 4) - 1)) for _ in range(4)]
+        width = max(len(n) for n in numbers)
+        align_left = rng.random() < 0.5
+        for row, number in zip(rows, numbers):
+            row.append(number.ljust(width) if align_left else number.rjust(width))
+        rows[4].append(rng.choice('+*').ljust(width))
+    return '\n'.join(' '.join(row) for row in rows) + '\n'
+
+
+def generate_day7(size, seed=0):
+    """
+    Tachyon manifold: 'S' in the top row and splitters '^' on every second row.
+    """
+    rng = make_rng(7, size, seed)
+    side = grid_side(141, size)
+    start = side // 2
+    lines = ['.' * start + 'S' + '.' * (side - start - 1)]
+    for r in range(1, side):
+        if r % 2 == 1:
+            lines.append('.' * side)
+        else:
+            lines.append(''.join('^' if rng.random() < 0.18 else '.' for _ in range(side)))
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day8(size, seed=0):
+    """
+    Junction box coordinates "x,y,z", one per line.
+    """
+    rng = make_rng(8, size, seed)
+    lines = []
+    for _ in range(1000 * size):
+        lines.append(f'{rng.randint(0, 99999)},{rng.randint(0, 99999)},{rng.randint(0, 99999)}')
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day9(size, seed=0):
+    """
+    Red tiles "x,y" forming a simple rectilinear polygon: neighbouring points
+    (and the last and first point) share either the x or the y coordinate.
+    The polygon is a band between a random upper and lower staircase.
+    """
+    rng = make_rng(9, size, seed)
+    steps = 124 * size
+    xs = sorted(rng.sample(range(1, 100 * steps + 1000), steps + 1))
+    top = [rng.randint(60_000, 99_999) for _ in range(steps)]
+    bottom = [rng.randint(1, 40_000) for _ in range(steps)]
+
+    points = []
+    for i in range(steps): # upper staircase from left to right
+        points.append((xs[i], top[i]))
+        points.append((xs[i + 1], top[i]))
+    for i in range(steps - 1, -1, -1): # lower staircase back from right to left
+        points.append((xs[i + 1], bottom[i]))
+        points.append((xs[i], bottom[i]))
+    return '\n'.join(f'{x},{y}' for x, y in points) + '\n'
+
+
+def generate_day10(size, seed=0):
+    """
+    Machine lines like "[.##.] (3) (1,3) (2) {3,5,4,7}". The joltage targets
+    are built from random press counts, so every machine has a solution.
+    """
+    rng = make_rng(10, size, seed)
+    lines = []
+    for _ in range(180 * size):
+        counters = rng.randint(4, 10)
+        buttons = []
+        for _ in range(rng.randint(counters - 2, counters + 3)):
+            buttons.append(sorted(rng.sample(range(counters), rng.randint(1, counters - 1))))
+        covered = {c for button in buttons for c in button}
+        for c in range(counters): # every counter needs at least one button
+            if c not in covered:
+                buttons.append([c])
+
+        targets = [0] * counters
+        for button in buttons:
+            presses = rng.randint(0, 30)
+            for c in button:
+                targets[c] += presses
+
+        lights = ''.join(rng.choice('.#') for _ in range(counters))
+        button_text = ' '.join('(' + ','.join(map(str, b)) + ')' for b in buttons)
+        lines.append(f"[{lights}] {button_text} {{{','.join(map(str, targets))}}}")
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day11(size, seed=0):
+    """
+    Directed acyclic device graph "aaa: bbb ccc", with the special devices
+    you, svr, dac, fft and out. Edges only point to devices later in a random
+    topological order, so the graph never has cycles.
+    """
+    rng = make_rng(11, size, seed)
+    count = 545 * size
+    names = node_names(count - 5, rng)
+    # Special devices at fixed spots of the topological order
+    names.insert(0, 'svr')
+    names.insert(count // 10, 'you')
+    names.insert(count // 3, 'fft')
+    names.insert(2 * count // 3, 'dac')
+    names.append('out')
+
+    def jump(i):
+        # mostly short jumps, so paths get long and many
+        return min(count - 1, i + 1 + int(rng.expovariate(1 / 20)))
+
+    edges = [set() for _ in range(count)]
+    for i in range(count - 1):
+        for _ in range(rng.randint(1, 4)):
+            edges[i].add(jump(i))
+
+    # Every device is reachable from svr: each one gets an edge from an earlier device
+    reached = {j for targets in edges for j in targets}
+    for j in range(1, count):
+        if j not in reached:
+            edges[rng.randint(max(0, j - 20), j - 1)].add(j)
+
+    # There is at least one path fft -> dac
+    i, dac = count // 3, 2 * count // 3
+    while i != dac:
+        j = min(dac, jump(i))
+        edges[i].add(j)
+        i = j
+
+    lines = []
+    for i in range(count - 1):
+        lines.append(f"{names[i]}: {' '.join(sorted(names[j] for j in edges[i]))}")
+    rng.shuffle(lines)
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day12(size, seed=0):
+    """
+    Six 3x3 present shapes followed by regions "WxH: c0 c1 c2 c3 c4 c5".
+    """
+    rng = make_rng(12, size, seed)
+    blocks = []
+    shape_cells = [] # number of '#' of every shape
+    for shape_id in range(6):
+        while True:
+            cells = [[rng.random() < 0.7 for _ in range(3)] for _ in range(3)]
+            # keep the full 3x3 bounding box, like the real shapes
+            if all(any(row) for row in cells) and all(any(col) for col in zip(*cells)):
+                break
+        rows = [''.join('#' if cell else '.' for cell in row) for row in cells]
+        blocks.append(f'{shape_id}:\n' + '\n'.join(rows))
+        shape_cells.append(sum(row.count('#') for row in rows))
+
+    regions = []
+    for _ in range(1000 * size):
+        width = rng.randint(35, 50)
+        height = rng.randint(35, 50)
+        area = width * height
+        # like the real input: either clearly fits (~70% of the area) or is too full,
+        # nothing in between where the solver can neither place nor reject quickly
+        fits = rng.random() < 0.5
+        ratio = rng.uniform(0.6, 0.72) if fits else rng.uniform(1.05, 1.2)
+        weights = [max(0.0, rng.gauss(1, 0.2)) for _ in range(6)]
+        scale = ratio * area / sum(w * c for w, c in zip(weights, shape_cells))
+        counts = [round(w * scale) for w in weights]
+
+        # rounding can move the total area, push it back into its band
+        while fits and present_area(counts, shape_cells) > 0.75 * area:
+            counts[counts.index(max(counts))] -= 1
+        while not fits and present_area(counts, shape_cells) < 1.02 * area:
+            counts[rng.randrange(6)] += 1
+        regions.append(f"{width}x{height}: {' '.join(map(str, counts))}")
+    return '\n\n'.join(blocks) + '\n\n' + '\n'.join(regions) + '\n'
+
+
+GENERATORS = {
+    1: generate_day1,
+    2: generate_day2,
+    3: generate_day3,
+    4: generate_day4,
+    5: generate_day5,
+    6: generate_day6,
+    7: generate_day7,
+    8: generate_day8,
+    9: generate_day9,
+    10: generate_day10,
+    11: generate_day11,
+    12: generate_day12,
+}
+
+
+# Generator version per day, 1 if not listed
+VERSIONS = {
+    4: 2, # random.choices instead of one random() call per cell
+    12: 2, # region counts scaled to the real shape areas
+}
+
+
+def version(day):
+    """
+    Version of the generator of the given day.
+    """
+    return VERSIONS.get(day, 1)
+
+
+def generate(day, size, seed=0):
+    """
+    Generates the input text for the given day.
+    """
+    return GENERATORS[day](size, seed)